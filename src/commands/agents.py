@@ -1,5 +1,6 @@
 """Agents command group - AI agent management, orchestration, LLM control."""
 
+import os
 import subprocess
 from pathlib import Path
 
@@ -31,12 +32,16 @@ def list_agents():
     table.add_column("File", style="dim")
     table.add_column("Size", justify="right")
 
-    for py_file in sorted(agents_dir.glob("*.py")):
-        if py_file.name.startswith("__"):
-            continue
-        name = py_file.stem.replace("_", " ").title()
-        size = py_file.stat().st_size
-        table.add_row(name, py_file.name, f"{size:,} B")
+    with os.scandir(agents_dir) as it:
+        agent_files = [
+            (entry.name, entry.stat().st_size)
+            for entry in it
+            if entry.name.endswith(".py") and not entry.name.startswith("__")
+        ]
+
+    for file_name, size in sorted(agent_files):
+        name = file_name[:-3].replace("_", " ").title()
+        table.add_row(name, file_name, f"{size:,} B")
 
     console.print(table)
 
@@ -89,8 +94,8 @@ def cook(
             table.add_column("#", style="bold cyan", justify="right")
             table.add_column("Task", style="bold")
             table.add_column("Description", style="dim")
-            for step in steps:
-                table.add_row(str(step["order"]), step["title"], step["description"][:70])
+            for order, title, description in steps:
+                table.add_row(str(order), title, description[:70])
             console.print(table)
     else:
         info_panel("Cook", f"Goal: {goal}")
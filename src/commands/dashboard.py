@@ -6,15 +6,14 @@ Uses Rich Layout + Live display with keyboard navigation.
 
 from __future__ import annotations
 
+import os
 import sys
 import time
-import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable
 
 import typer
-from rich.layout import Layout
-from rich.live import Live
 from rich.panel import Panel
-from rich.text import Text
 
 from src.core.console import console
 from src.core.collectors import (
@@ -23,25 +22,36 @@ from src.core.collectors import (
     collect_agents,
     collect_system,
 )
+from src.core.workers import get_executor
 
+if TYPE_CHECKING:
+    import selectors
 
-def _build_layout(focused: int = 0) -> Layout:
-    """Build the dashboard layout. If focused > 0, expand that panel."""
-    panels = {
-        1: collect_devops,
-        2: collect_revenue,
-        3: collect_agents,
-        4: collect_system,
-    }
+    from rich.layout import Layout
+
+# Panel number -> (layout slot in grid mode, collector)
+_PANELS: dict[int, tuple[str, Callable[[], Panel]]] = {
+    1: ("devops", collect_devops),
+    2: ("revenue", collect_revenue),
+    3: ("agents", collect_agents),
+    4: ("system", collect_system),
+}
+
+# Panels whose data rarely changes are re-collected at most this often (seconds)
+_PANEL_MIN_TTL: dict[int, float] = {4: 300.0}
+
+
+def _new_layout(focused: int = 0) -> Layout:
+    """Build the empty layout skeleton. If focused > 0, a single expanded panel."""
+    from rich.layout import Layout
 
     # Focused mode: show single panel expanded
-    if focused in panels:
+    if focused in _PANELS:
         layout = Layout()
         layout.split_column(
             Layout(name="main", ratio=8),
             Layout(name="footer", size=3),
         )
-        layout["main"].update(panels[focused]())
         layout["footer"].update(Panel(
             "[bold]q[/bold] Quit  [bold]r[/bold] Refresh  "
             "[bold]0[/bold] Grid view  "
@@ -65,48 +75,58 @@ def _build_layout(focused: int = 0) -> Layout:
         Layout(name="agents"),
         Layout(name="system"),
     )
-
-    layout["devops"].update(panels[1]())
-    layout["revenue"].update(panels[2]())
-    layout["agents"].update(panels[3]())
-    layout["system"].update(panels[4]())
-
     layout["footer"].update(Panel(
         "[bold]q[/bold] Quit  [bold]r[/bold] Refresh  "
         "[bold]1-4[/bold] Focus panel  "
         "[dim]Auto-refresh active[/dim]",
         style="dim",
     ))
-
     return layout
 
 
-def _key_listener(state: dict) -> None:
-    """Background thread reading single keystrokes via tty raw mode."""
-    try:
-        import tty
-        import termios
+def _visible_slots(focused: int) -> dict[int, str]:
+    """Map each visible panel number to its layout slot name."""
+    if focused in _PANELS:
+        return {focused: "main"}
+    return {key: slot for key, (slot, _) in _PANELS.items()}
+
+
+def _submit(keys: list[int]) -> dict[int, Future[Panel]]:
+    """Start the given panels' collectors on the shared pool."""
+    executor = get_executor()
+    return {key: executor.submit(_PANELS[key][1]) for key in keys}
+
+
+def _collect(
+    keys: list[int], started: dict[int, Future[Panel]] | None = None,
+) -> dict[int, Panel]:
+    """Run the given panels' collectors concurrently, reusing any ``started`` futures."""
+    futures = dict(started or {})
+    missing = [key for key in keys if key not in futures]
+    futures.update(_submit(missing))
+    return {key: futures[key].result() for key in keys}
 
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            while state["running"]:
-                ch = sys.stdin.read(1)
-                if ch in ("q", "Q", "\x03"):  # q or Ctrl+C
-                    state["running"] = False
-                elif ch == "r":
-                    state["refresh"] = True
-                elif ch in "01234":
-                    state["focused"] = int(ch)
-                    state["refresh"] = True
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    except (ImportError, OSError):
-        # Not a real terminal (e.g., piped input, Windows without tty)
-        # Just wait until state["running"] is False
-        while state["running"]:
-            time.sleep(0.5)
+
+def _build_layout(focused: int = 0, started: dict[int, Future[Panel]] | None = None) -> Layout:
+    """Build a fully populated dashboard layout. If focused > 0, expand that panel."""
+    layout = _new_layout(focused)
+    slots = _visible_slots(focused)
+    for key, panel in _collect(list(slots), started).items():
+        layout[slots[key]].update(panel)
+    return layout
+
+
+def _wait_for_key(
+    selector: selectors.BaseSelector | None, fd: int, timeout: float,
+) -> str | None:
+    """Block until a key is pressed or ``timeout`` elapses. Return the key, or None on timeout."""
+    if selector is None:
+        # Not a real terminal: nothing to listen for, just wait out the interval
+        time.sleep(timeout)
+        return None
+    if not selector.select(timeout=timeout):
+        return None
+    return os.read(fd, 1).decode(errors="ignore")
 
 
 def dash(
@@ -114,30 +134,89 @@ def dash(
     no_interactive: bool = typer.Option(False, "--no-interactive", help="Single render, no live mode"),
 ):
     """Launch interactive terminal dashboard."""
+    # Start the first collection right away: the collectors' imports and probes then run
+    # while this thread loads Live and sets up the terminal
+    first = _submit(list(_visible_slots(0)))
+
+    # Live/selectors are only needed here; keep them off every other command's startup path
+    import selectors
+
+    from rich.live import Live
+
     if no_interactive:
         # Single render for testing or piped output
-        console.print(_build_layout(0))
+        console.print(_build_layout(0, first))
         return
 
-    state = {"running": True, "refresh": False, "focused": 0}
-
-    # Start keyboard listener in background thread
-    listener = threading.Thread(target=_key_listener, args=(state,), daemon=True)
-    listener.start()
+    # Keyboard input is multiplexed on the main thread: select() on stdin with the
+    # refresh interval as timeout, so keys redraw immediately and idle ticks cost nothing
+    selector: selectors.BaseSelector | None = None
+    fd = -1
+    old_settings = None
+    try:
+        import termios
+        import tty
 
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        tty.setraw(fd)
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+    except ImportError:
+        # No termios (e.g., Windows)
+        selector = None
+    except (termios.error, OSError, ValueError):
+        # Not a real terminal (e.g., piped input)
+        selector = None
+
+    # The layout tree is only rebuilt when the view changes; each tick re-collects
+    # just the visible panels whose data is older than their refresh interval
+    focused = 0
+    layout = _new_layout(focused)
+    panels: dict[int, Panel] = {}
+    collected_at: dict[int, float] = {}
+    force = True
     try:
-        with Live(console=console, auto_refresh=False, screen=True) as live:
-            while state["running"]:
-                live.update(_build_layout(state["focused"]))
+        with Live(layout, console=console, auto_refresh=False, screen=True) as live:
+            running = True
+            while running:
+                now = time.monotonic()
+                slots = _visible_slots(focused)
+                stale = [
+                    key for key in slots
+                    if force or key not in panels
+                    or now - collected_at[key] >= max(refresh, _PANEL_MIN_TTL.get(key, 0.0))
+                ]
+                panels.update(_collect(stale, first))
+                first = {}
+                collected_at.update(dict.fromkeys(stale, now))
+                for key, slot in slots.items():
+                    layout[slot].update(panels[key])
                 live.refresh()
+                force = False
 
-                # Sleep in small increments for responsive key handling
-                for _ in range(refresh * 10):
-                    if not state["running"] or state["refresh"]:
+                deadline = time.monotonic() + refresh
+                while True:
+                    ch = _wait_for_key(selector, fd, max(0.0, deadline - time.monotonic()))
+                    if ch in ("q", "Q", "\x03"):  # q or Ctrl+C
+                        running = False
+                        break
+                    if ch is None:
+                        break
+                    if ch == "r":
+                        force = True
+                        break
+                    if ch and ch in "01234":
+                        if int(ch) != focused:
+                            focused = int(ch)
+                            layout = _new_layout(focused)
+                            live.update(layout)
                         break
-                    time.sleep(0.1)
-                state["refresh"] = False
     except KeyboardInterrupt:
         pass
     finally:
+        if selector is not None:
+            selector.close()
+        if old_settings is not None:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         console.print("[dim]Dashboard closed.[/dim]")
@@ -2,16 +2,95 @@
 
 from __future__ import annotations
 
+import os
+import signal
 import subprocess
+import threading
+import time
+from collections import deque
 from pathlib import Path
+from typing import IO, Callable, Optional
 
 import typer
 from rich.table import Table
 
+from src.core import jsonx
+from src.core.config import get_config
 from src.core.console import console, success_panel, error_panel, info_panel
 
 devops_app = typer.Typer(help="DevOps: deploy, monitor, manage infrastructure")
 
+# Seconds a cached `devops status` probe result stays fresh
+_STATUS_CACHE_TTL = 30.0
+
+# Lines of stdout/stderr kept from long-running commands; only the tail is ever shown
+_TAIL_LINES = 20
+
+# Seconds to wait for output readers after killing a command that timed out
+_KILL_GRACE = 2.0
+
+
+def _drain(pipe: IO[str], sink: deque, echo: bool) -> None:
+    """Consume a pipe line by line, keeping only the tail (optionally echoing)."""
+    for line in pipe:
+        sink.append(line)
+        if echo:
+            console.print(line, end="", markup=False)
+    pipe.close()
+
+
+def _kill_group(proc: subprocess.Popen) -> None:
+    """Kill a command started in its own session, together with everything it spawned."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _run_tail(
+    cmd: list[str],
+    cwd: Optional[Path] = None,
+    timeout: Optional[float] = None,
+    echo: bool = False,
+) -> tuple[int, str, str]:
+    """Run a command streaming its output, returning (returncode, stdout tail, stderr tail).
+
+    Unlike ``subprocess.run(capture_output=True)`` memory stays bounded by
+    ``_TAIL_LINES`` regardless of how verbose the command is.
+    Raises FileNotFoundError / subprocess.TimeoutExpired like ``subprocess.run``.
+
+    The command runs in its own session so that on timeout (or Ctrl+C) its
+    whole process group is killed, including children still holding the pipes.
+    """
+    proc = subprocess.Popen(
+        cmd, cwd=cwd,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors="replace",
+        start_new_session=True,
+    )
+    out: deque = deque(maxlen=_TAIL_LINES)
+    err: deque = deque(maxlen=_TAIL_LINES)
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, out, echo), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, err, False), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except BaseException:
+        _kill_group(proc)
+        proc.wait()
+        # Don't hang on a descendant that escaped the group and still holds a pipe
+        for reader in readers:
+            reader.join(_KILL_GRACE)
+        raise
+    for reader in readers:
+        reader.join()
+    return returncode, "".join(out), "".join(err)
+
 
 @devops_app.command()
 def deploy(
@@ -26,15 +105,9 @@ def deploy(
         error_panel("Deploy Error", f"Project not found: {project_path}")
         raise typer.Exit(code=1)
 
-    deployers = {
-        "vercel": _deploy_vercel,
-        "cloudflare": _deploy_cloudflare,
-        "docker": _deploy_docker,
-    }
-
-    deployer = deployers.get(target)
+    deployer = _DEPLOYERS.get(target)
     if not deployer:
-        error_panel("Deploy Error", f"Unknown target: {target}. Use: {', '.join(deployers)}")
+        error_panel("Deploy Error", f"Unknown target: {target}. Use: {_DEPLOY_TARGETS}")
         raise typer.Exit(code=1)
 
     deployer(project_path, prod)
@@ -43,23 +116,22 @@ def deploy(
 @devops_app.command()
 def status(
     project: str = typer.Option(".", "--project", "-p", help="Project directory"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached results and re-check"),
 ):
     """Check deployment status across platforms."""
     project_path = Path(project).resolve()
+    cache = _load_status_cache()
 
     table = Table(title="Deployment Status")
     table.add_column("Platform", style="cyan")
     table.add_column("Status")
     table.add_column("URL", style="dim")
 
-    # Check Vercel
-    vercel_status = _check_vercel(project_path)
-    table.add_row("Vercel", vercel_status["status"], vercel_status.get("url", "-"))
-
-    # Check git status
-    git_status = _check_git(project_path)
-    table.add_row("Git", git_status["status"], git_status.get("branch", "-"))
+    checks = _run_status_checks(cache, project_path, not no_cache)
+    table.add_row("Vercel", checks["vercel"]["status"], checks["vercel"].get("url", "-"))
+    table.add_row("Git", checks["git"]["status"], checks["git"].get("branch", "-"))
 
+    _save_status_cache(cache)
     console.print(table)
 
 
@@ -69,18 +141,14 @@ def logs(
     lines: int = typer.Option(50, "--lines", "-n", help="Number of log lines"),
 ):
     """Fetch deployment logs."""
+    build_cmd = _LOG_COMMANDS.get(target)
+    if not build_cmd:
+        error_panel("Logs Error", f"Unsupported platform: {target}")
+        return
     try:
-        if target == "vercel":
-            result = subprocess.run(
-                ["vercel", "logs", "--limit", str(lines)],
-                capture_output=True, text=True, timeout=30,
-            )
-            if result.returncode == 0:
-                console.print(result.stdout)
-            else:
-                error_panel("Logs Error", result.stderr or "Failed to fetch logs")
-        else:
-            error_panel("Logs Error", f"Unsupported platform: {target}")
+        returncode, _, stderr = _run_tail(build_cmd(lines), timeout=30, echo=True)
+        if returncode != 0:
+            error_panel("Logs Error", stderr or "Failed to fetch logs")
     except FileNotFoundError:
         error_panel("Logs Error", f"{target} CLI not installed")
     except subprocess.TimeoutExpired:
@@ -97,17 +165,13 @@ def build(
 
     with console.status("[bold green]Building..."):
         try:
-            result = subprocess.run(
-                cmd.split(),
-                cwd=project_path,
-                capture_output=True, text=True, timeout=300,
-            )
-            if result.returncode == 0:
+            returncode, stdout, stderr = _run_tail(cmd.split(), cwd=project_path, timeout=300)
+            if returncode == 0:
                 success_panel("Build", "Build completed successfully")
-                if result.stdout:
-                    console.print(f"[dim]{result.stdout[-500:]}[/dim]")
+                if stdout:
+                    console.print(f"[dim]{stdout[-500:]}[/dim]")
             else:
-                error_panel("Build Failed", result.stderr[-500:] if result.stderr else "Unknown error")
+                error_panel("Build Failed", stderr[-500:] if stderr else "Unknown error")
                 raise typer.Exit(code=1)
         except FileNotFoundError:
             error_panel("Build Error", f"Command not found: {cmd.split()[0]}")
@@ -125,15 +189,12 @@ def _deploy_vercel(project_path: Path, prod: bool) -> None:
 
     with console.status("[bold green]Deploying to Vercel..."):
         try:
-            result = subprocess.run(
-                cmd, cwd=project_path,
-                capture_output=True, text=True, timeout=120,
-            )
-            if result.returncode == 0:
-                url = result.stdout.strip().split("\n")[-1]
+            returncode, stdout, stderr = _run_tail(cmd, cwd=project_path, timeout=120)
+            if returncode == 0:
+                url = stdout.strip().split("\n")[-1]
                 success_panel("Vercel Deploy", f"Deployed: {url}")
             else:
-                error_panel("Vercel Error", result.stderr or "Deploy failed")
+                error_panel("Vercel Error", stderr or "Deploy failed")
                 raise typer.Exit(code=1)
         except FileNotFoundError:
             error_panel("Vercel Error", "vercel CLI not installed. Run: npm i -g vercel")
@@ -148,14 +209,11 @@ def _deploy_cloudflare(project_path: Path, prod: bool) -> None:
 
     with console.status("[bold green]Deploying to Cloudflare..."):
         try:
-            result = subprocess.run(
-                cmd, cwd=project_path,
-                capture_output=True, text=True, timeout=120,
-            )
-            if result.returncode == 0:
-                success_panel("Cloudflare Deploy", result.stdout[-200:] if result.stdout else "OK")
+            returncode, stdout, stderr = _run_tail(cmd, cwd=project_path, timeout=120)
+            if returncode == 0:
+                success_panel("Cloudflare Deploy", stdout[-200:] if stdout else "OK")
             else:
-                error_panel("Cloudflare Error", result.stderr or "Deploy failed")
+                error_panel("Cloudflare Error", stderr or "Deploy failed")
                 raise typer.Exit(code=1)
         except FileNotFoundError:
             error_panel("Cloudflare Error", "wrangler CLI not installed. Run: npm i -g wrangler")
@@ -168,53 +226,121 @@ def _deploy_docker(project_path: Path, prod: bool) -> None:
 
     with console.status("[bold green]Building Docker image..."):
         try:
-            result = subprocess.run(
+            returncode, _, stderr = _run_tail(
                 ["docker", "build", "-t", f"mekon-app:{tag}", "."],
-                cwd=project_path,
-                capture_output=True, text=True, timeout=300,
+                cwd=project_path, timeout=300,
             )
-            if result.returncode == 0:
+            if returncode == 0:
                 success_panel("Docker Build", f"Image built: mekon-app:{tag}")
             else:
-                error_panel("Docker Error", result.stderr[-300:] if result.stderr else "Build failed")
+                error_panel("Docker Error", stderr[-300:] if stderr else "Build failed")
                 raise typer.Exit(code=1)
         except FileNotFoundError:
             error_panel("Docker Error", "docker not installed")
             raise typer.Exit(code=1)
 
 
-def _check_vercel(project_path: Path) -> dict[str, str]:
-    """Check Vercel deployment status."""
+_DEPLOYERS: dict[str, Callable[[Path, bool], None]] = {
+    "vercel": _deploy_vercel,
+    "cloudflare": _deploy_cloudflare,
+    "docker": _deploy_docker,
+}
+_DEPLOY_TARGETS = ", ".join(_DEPLOYERS)
+
+# Platform -> command that fetches its last N log lines
+_LOG_COMMANDS: dict[str, Callable[[int], list[str]]] = {
+    "vercel": lambda lines: ["vercel", "logs", "--limit", str(lines)],
+}
+
+
+def _status_cache_file() -> Path:
+    """Location of the persisted `devops status` results."""
+    return get_config().data_path / "cache" / "devops_status.json"
+
+
+def _load_status_cache() -> dict[str, dict]:
+    """Load cached status results keyed by "platform:project", or {} if unavailable."""
     try:
-        result = subprocess.run(
-            ["vercel", "ls", "--json"],
-            cwd=project_path,
-            capture_output=True, text=True, timeout=15,
-        )
-        if result.returncode == 0:
-            return {"status": "[green]active[/green]", "url": "See vercel dashboard"}
-        return {"status": "[yellow]unknown[/yellow]"}
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return {"status": "[dim]not configured[/dim]"}
+        cache = jsonx.loads(_status_cache_file().read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
 
 
-def _check_git(project_path: Path) -> dict[str, str]:
-    """Check git status."""
+def _save_status_cache(cache: dict[str, dict]) -> None:
+    """Persist status results, dropping expired ones; failures only cost a re-check."""
+    now = time.time()
+    fresh = {k: v for k, v in cache.items() if now - v.get("at", 0) < _STATUS_CACHE_TTL}
+    path = _status_cache_file()
     try:
-        branch = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=project_path,
-            capture_output=True, text=True, timeout=5,
-        )
-        status = subprocess.run(
-            ["git", "status", "--porcelain"],
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(jsonx.dumps_compact(fresh))
+    except OSError:
+        pass
+
+
+def _parse_vercel(result: Optional[subprocess.CompletedProcess]) -> dict[str, str]:
+    """Interpret `vercel ls --json` (None: vercel missing or timed out)."""
+    if result is None:
+        return {"status": "[dim]not configured[/dim]"}
+    if result.returncode == 0:
+        return {"status": "[green]active[/green]", "url": "See vercel dashboard"}
+    return {"status": "[yellow]unknown[/yellow]"}
+
+
+def _parse_git(result: Optional[subprocess.CompletedProcess]) -> dict[str, str]:
+    """Interpret `git status --branch --porcelain=v2` (branch and dirtiness in one call)."""
+    if result is None or result.returncode != 0:
+        return {"status": "[dim]not a git repo[/dim]"}
+
+    branch = ""
+    clean = True
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.head "):
+            branch = line[len("# branch.head "):]
+        elif not line.startswith("#"):
+            clean = False
+    return {
+        "status": "[green]clean[/green]" if clean else "[yellow]dirty[/yellow]",
+        "branch": branch,
+    }
+
+
+# Platform -> (probe command, timeout in seconds, result parser)
+_STATUS_CHECKS: dict[
+    str, tuple[list[str], float, Callable[[Optional[subprocess.CompletedProcess]], dict[str, str]]]
+] = {
+    "vercel": (["vercel", "ls", "--json"], 15, _parse_vercel),
+    "git": (["git", "status", "--branch", "--porcelain=v2"], 5, _parse_git),
+}
+
+
+def _run_status_checks(
+    cache: dict[str, dict], project_path: Path, use_cache: bool = True,
+) -> dict[str, dict[str, str]]:
+    """Return each platform's status, serving fresh cached results and probing the rest.
+
+    Stale platforms are probed concurrently on one event loop.
+    """
+    from src.core.subproc import run_probes
+
+    now = time.time()
+    results: dict[str, dict[str, str]] = {}
+    stale: list[str] = []
+    for platform in _STATUS_CHECKS:
+        hit = cache.get(f"{platform}:{project_path}")
+        if use_cache and hit and now - hit.get("at", 0) < _STATUS_CACHE_TTL:
+            results[platform] = hit["result"]
+        else:
+            stale.append(platform)
+
+    if stale:
+        probes = run_probes(
+            [_STATUS_CHECKS[p][0] for p in stale],
+            timeout=[_STATUS_CHECKS[p][1] for p in stale],
             cwd=project_path,
-            capture_output=True, text=True, timeout=5,
         )
-        clean = len(status.stdout.strip().split("\n")) == 1 and not status.stdout.strip()
-        return {
-            "status": "[green]clean[/green]" if clean else "[yellow]dirty[/yellow]",
-            "branch": branch.stdout.strip(),
-        }
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return {"status": "[dim]not a git repo[/dim]"}
+        for platform, probe in zip(stale, probes):
+            results[platform] = _STATUS_CHECKS[platform][2](probe)
+            cache[f"{platform}:{project_path}"] = {"at": now, "result": results[platform]}
+    return results
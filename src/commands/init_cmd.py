@@ -5,14 +5,15 @@ Creates .env, data directories, detects mekong-cli, and runs health checks.
 
 from __future__ import annotations
 
+import os
 import shutil
-import subprocess
 import sys
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 import typer
 
-from src.core.config import get_config
+from src.core.config import get_config, invalidate_config
 from src.core.console import console, success_panel, error_panel, info_panel
 
 
@@ -20,6 +21,9 @@ _DATA_SUBDIRS = ("revenue", "logs", "recipes")
 _ENV_EXAMPLE = Path(".env.example")
 _ENV_FILE = Path(".env")
 
+# Paths already found missing in this process; skips repeat stat calls on re-detection
+_MISSING_PATHS: set[str] = set()
+
 
 def _copy_env_template() -> str:
     """Copy .env.example to .env if .env does not exist. Return status message."""
@@ -28,34 +32,60 @@ def _copy_env_template() -> str:
     if not _ENV_EXAMPLE.exists():
         return "[yellow]template .env.example not found[/yellow]"
     shutil.copy2(_ENV_EXAMPLE, _ENV_FILE)
+    # Settings loaded before the copy would not reflect the new .env
+    invalidate_config()
     return "[green]created from .env.example[/green]"
 
 
 def _create_data_dirs(base: Path) -> list[str]:
-    """Create ~/.mekon and subdirectories. Return list of status lines."""
+    """Create ~/.mekon and subdirectories. Return list of status lines.
+
+    One directory listing tells which subdirectories already exist, so a re-init
+    issues no mkdir calls at all.
+    """
     lines: list[str] = []
-    base.mkdir(parents=True, exist_ok=True)
-    lines.append(f"  {base} [green]ready[/green]")
+    try:
+        with os.scandir(base) as it:
+            existing = {entry.name for entry in it if entry.is_dir()}
+        lines.append(f"  {base} [green]ready[/green]")
+    except FileNotFoundError:
+        os.makedirs(base, exist_ok=True)
+        existing = set()
+        lines.append(f"  {base} [green]ready (created)[/green]")
     for sub in _DATA_SUBDIRS:
         p = base / sub
-        p.mkdir(parents=True, exist_ok=True)
-        lines.append(f"  {p} [green]ready[/green]")
+        if sub in existing:
+            lines.append(f"  {p} [green]ready[/green]")
+        else:
+            os.makedirs(p, exist_ok=True)
+            lines.append(f"  {p} [green]ready (created)[/green]")
     return lines
 
 
+def _path_exists(path: Path) -> bool:
+    """Single-stat existence check that remembers misses for the rest of the process."""
+    key = str(path)
+    if key in _MISSING_PATHS:
+        return False
+    try:
+        os.stat(key)
+    except OSError:
+        _MISSING_PATHS.add(key)
+        return False
+    return True
+
+
 def _detect_mekong_cli() -> tuple[str, str]:
     """Auto-detect mekong-cli path. Return (path, status)."""
-    import os
-
     # Priority: env var > config > ../mekong-cli > ~/mekong-cli
     env_val = os.environ.get("MEKONG_CLI_PATH", "")
     if env_val:
         p = Path(env_val).expanduser().resolve()
-        if p.exists():
+        if _path_exists(p):
             return str(p), "[green]found (env)[/green]"
 
     cfg = get_config()
-    if cfg.mekong_path.exists():
+    if _path_exists(cfg.mekong_path):
         return str(cfg.mekong_path), "[green]found (config)[/green]"
 
     candidates = [
@@ -63,7 +93,7 @@ def _detect_mekong_cli() -> tuple[str, str]:
         Path.home() / "mekong-cli",
     ]
     for c in candidates:
-        if c.exists():
+        if _path_exists(c):
             return str(c), "[green]found[/green]"
 
     return "", "[yellow]not found[/yellow]"
@@ -77,17 +107,9 @@ def _run_health_check() -> list[str]:
 
     for pkg in ("typer", "rich", "pydantic"):
         try:
-            result = subprocess.run(
-                [sys.executable, "-c", f"import {pkg}; print({pkg}.__version__)"],
-                capture_output=True, text=True, timeout=10,
-            )
-            if result.returncode == 0:
-                ver = result.stdout.strip()
-                lines.append(f"  {pkg} {ver} [green]OK[/green]")
-            else:
-                lines.append(f"  {pkg} [red]import error[/red]")
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            lines.append(f"  {pkg} [red]check failed[/red]")
+            lines.append(f"  {pkg} {version(pkg)} [green]OK[/green]")
+        except PackageNotFoundError:
+            lines.append(f"  {pkg} [red]not installed[/red]")
     return lines
 
 
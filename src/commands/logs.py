@@ -11,6 +11,27 @@ from src.core.logger import get_logger
 logs_app = typer.Typer(help="Activity log management")
 
 
+def _render_entries(entries: list[dict[str, str]], title: str) -> None:
+    """Print log entries as a table."""
+    table = Table(title=title)
+    table.add_column("Timestamp", style="dim")
+    table.add_column("Action", style="cyan")
+    table.add_column("Details")
+    table.add_column("Status", style="green")
+
+    for entry in entries:
+        get = entry.get
+        table.add_row(
+            # Trim microseconds for readability
+            get("timestamp", "").partition(".")[0],
+            get("action", ""),
+            get("details", ""),
+            get("status", ""),
+        )
+
+    console.print(table)
+
+
 @logs_app.command()
 def show(
     limit: int = typer.Option(50, "--limit", "-n", help="Number of entries to show"),
@@ -23,25 +44,7 @@ def show(
         console.print("[dim]No log entries found.[/dim]")
         return
 
-    table = Table(title=f"Activity Log (last {len(entries)})")
-    table.add_column("Timestamp", style="dim")
-    table.add_column("Action", style="cyan")
-    table.add_column("Details")
-    table.add_column("Status", style="green")
-
-    for entry in entries:
-        ts = entry.get("timestamp", "")
-        # Trim microseconds for readability
-        if "." in ts:
-            ts = ts.split(".")[0]
-        table.add_row(
-            ts,
-            entry.get("action", ""),
-            entry.get("details", ""),
-            entry.get("status", ""),
-        )
-
-    console.print(table)
+    _render_entries(entries, f"Activity Log (last {len(entries)})")
 
 
 @logs_app.command()
@@ -54,24 +57,7 @@ def tail() -> None:
         console.print("[dim]No log entries found.[/dim]")
         return
 
-    table = Table(title="Activity Log (tail)")
-    table.add_column("Timestamp", style="dim")
-    table.add_column("Action", style="cyan")
-    table.add_column("Details")
-    table.add_column("Status", style="green")
-
-    for entry in entries:
-        ts = entry.get("timestamp", "")
-        if "." in ts:
-            ts = ts.split(".")[0]
-        table.add_row(
-            ts,
-            entry.get("action", ""),
-            entry.get("details", ""),
-            entry.get("status", ""),
-        )
-
-    console.print(table)
+    _render_entries(entries, "Activity Log (tail)")
 
 
 @logs_app.command()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import socket
 import subprocess
 
 import typer
@@ -10,9 +11,20 @@ from rich.panel import Panel
 from rich.table import Table
 
 from src.core.console import console, info_panel, error_panel
+from src.core.workers import get_executor
 
 market_app = typer.Typer(help="Market: research, analyze, competitors")
 
+_TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+# One pass over the page for all counted tags instead of one scan per tag.
+# Each tag has its own group so m.lastindex identifies it without allocating a str.
+_TAG_RE = re.compile(rb"<(?:(div)|(a)|(img)|(script))[\s/>]", re.IGNORECASE)
+# Markup that is not elements: comments, and script/style bodies (the opening tag is kept)
+_NOT_MARKUP_RE = re.compile(
+    rb"<!--.*?(?:-->|$)|(<(?:script|style)\b[^>]*>).*?(?=</(?:script|style)\s*>|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 def _run_cmd(args: list[str], timeout: int = 10) -> str:
     """Run a subprocess command and return stdout, or empty string on failure."""
@@ -25,6 +37,63 @@ def _run_cmd(args: list[str], timeout: int = 10) -> str:
         return ""
 
 
+def _fetch_page(url: str, timeout: float = 20) -> tuple[bytes, str]:
+    """Fetch a page in-process, following redirects. Return (body, status code).
+
+    A URL without a scheme is fetched over http://, as curl did. Returns
+    (b"", "") if the URL cannot be reached.
+    """
+    import httpx
+
+    if "://" not in url:
+        url = f"http://{url}"
+    try:
+        resp = httpx.get(url, follow_redirects=True, timeout=timeout)
+    except (httpx.HTTPError, httpx.InvalidURL):
+        return b"", ""
+    return resp.content, str(resp.status_code)
+
+
+def _lookup_dns(domain: str) -> str:
+    """Return the first A record for a domain via the system resolver, or "unavailable"."""
+    try:
+        infos = socket.getaddrinfo(domain, None, socket.AF_INET, socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError):
+        return "unavailable"
+    return str(infos[0][4][0]) if infos else "unavailable"
+
+
+def _count_tags(html: bytes) -> tuple[int, int, int, int]:
+    """Count (div, a, img, script) elements in a page.
+
+    Uses lxml's C parser when the optional ``lxml`` extra is installed, otherwise
+    a single regex pass over the raw bytes. The regex pass first drops comments
+    and script/style bodies, so tags that only appear inside them are not counted
+    and both paths agree on ordinary pages.
+    """
+    try:
+        from lxml import etree
+        from lxml import html as lxml_html
+    except ImportError:
+        lxml_html = None
+
+    if lxml_html is not None:
+        try:
+            root = lxml_html.document_fromstring(html)
+        except (ValueError, etree.LxmlError):
+            pass
+        else:
+            by_tag = {"div": 0, "a": 0, "img": 0, "script": 0}
+            for el in root.iter("div", "a", "img", "script"):
+                by_tag[el.tag] += 1
+            return by_tag["div"], by_tag["a"], by_tag["img"], by_tag["script"]
+
+    counts = [0, 0, 0, 0, 0]
+    for m in _TAG_RE.finditer(_NOT_MARKUP_RE.sub(rb"\1", html)):
+        counts[m.lastindex or 0] += 1  # every match sets exactly one group
+    return counts[1], counts[2], counts[3], counts[4]
+
+
 @market_app.command()
 def research(
     domain: str = typer.Argument(..., help="Domain to research (e.g. example.com)"),
@@ -32,12 +101,13 @@ def research(
     """Research a domain: DNS records, server info, HTTP headers."""
     info_panel("Domain Research", f"Researching: {domain}")
 
-    # DNS lookup
-    dns_output = _run_cmd(["dig", "+short", domain]) or _run_cmd(["nslookup", domain])
-    dns_summary = dns_output.split("\n")[0] if dns_output else "unavailable"
+    # DNS lookup and HTTP headers are independent network round-trips; run them together
+    executor = get_executor()
+    dns_future = executor.submit(_lookup_dns, domain)
+    header_future = executor.submit(_run_cmd, ["curl", "-sI", f"https://{domain}"], 15)
+    dns_summary = dns_future.result()
+    header_output = header_future.result()
 
-    # HTTP headers
-    header_output = _run_cmd(["curl", "-sI", f"https://{domain}"], timeout=15)
     server = ""
     tech_hints: list[str] = []
     status_line = ""
@@ -73,26 +143,23 @@ def analyze(
     """Quick page analysis: title, size, status, element counts."""
     info_panel("Page Analysis", f"Fetching: {url}")
 
-    body = _run_cmd(["curl", "-sL", "-w", "\n%{http_code}", url], timeout=20)
-    if not body:
+    # Keep the page as bytes: regexes scan it directly and its size needs no re-encode
+    html, status_code = _fetch_page(url)
+    if not status_code:
         error_panel("Fetch Failed", f"Could not reach {url}")
         raise typer.Exit(code=1)
 
-    lines = body.rsplit("\n", 1)
-    html = lines[0] if len(lines) == 2 else body
-    status_code = lines[1] if len(lines) == 2 else "unknown"
-
     # Extract title
-    title_match = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
-    title = title_match.group(1).strip() if title_match else "no title"
+    title_match = _TITLE_RE.search(html)
+    title = (
+        title_match.group(1).strip().decode("utf-8", errors="replace")
+        if title_match else "no title"
+    )
 
     # Count elements
-    divs = len(re.findall(r"<div[\s>]", html, re.IGNORECASE))
-    links = len(re.findall(r"<a[\s>]", html, re.IGNORECASE))
-    images = len(re.findall(r"<img[\s>]", html, re.IGNORECASE))
-    scripts = len(re.findall(r"<script[\s>]", html, re.IGNORECASE))
+    divs, links, images, scripts = _count_tags(html)
 
-    size_kb = len(html.encode("utf-8", errors="replace")) / 1024
+    size_kb = len(html) / 1024
 
     content = (
         f"[bold]Title:[/bold] {title}\n"
@@ -1,14 +1,20 @@
 """Marketing command group - lead hunting, content generation, campaigns."""
 
 import typer
-from rich.table import Table
+from rich.console import Group, RenderableType
 from rich.panel import Panel
 
-from src.core.console import console, info_panel, error_panel
+from src.core.console import console, info_panel, error_panel, make_table
 from src.core.engine import run_goal, plan_goal
 
 marketing_app = typer.Typer(help="Marketing: leads, content, campaigns")
 
+# Static column layouts for the plan step tables
+_STEP_NO = ("#", {"style": "bold cyan", "justify": "right"})
+_HUNT_COLUMNS = (_STEP_NO, ("Step", {"style": "bold"}), ("Details", {"style": "dim"}))
+_CONTENT_COLUMNS = (_STEP_NO, ("Step", {"style": "bold"}))
+_CAMPAIGN_COLUMNS = (_STEP_NO, ("Action", {"style": "bold"}), ("Description", {"style": "dim"}))
+
 
 @marketing_app.command()
 def hunt(
@@ -29,22 +35,20 @@ def hunt(
         console.print("[dim]Tip: Ensure MEKONG_CLI_PATH points to mekong-cli[/dim]")
         return
 
-    console.print(Panel(
+    # Collect the plan output and print it in one render
+    renderables: list[RenderableType] = [Panel(
         f"[bold]{result.get('name', 'Lead Hunt Plan')}[/bold]\n{result.get('description', '')}",
         title="Lead Hunt Plan",
         border_style="cyan",
-    ))
+    )]
 
     steps = result.get("steps", [])
     if steps:
-        table = Table(title="Hunt Steps")
-        table.add_column("#", style="bold cyan", justify="right")
-        table.add_column("Step", style="bold")
-        table.add_column("Details", style="dim")
-
-        for step in steps:
-            table.add_row(str(step["order"]), step["title"], step["description"][:60])
-        console.print(table)
+        table = make_table(_HUNT_COLUMNS, title="Hunt Steps")
+        for order, title, description in steps:
+            table.add_row(str(order), title, description[:60])
+        renderables.append(table)
+    console.print(Group(*renderables))
 
 
 @marketing_app.command()
@@ -75,22 +79,20 @@ def content(
             error_panel("Content Error", result.get("message", "Engine not available"))
             return
 
-        console.print(Panel(
+        renderables: list[RenderableType] = [Panel(
             f"[bold]{result.get('name', '')}[/bold]\n{result.get('description', '')}",
             title=f"Content Plan: {label}",
             border_style="cyan",
-        ))
+        )]
 
         steps = result.get("steps", [])
         if steps:
-            table = Table(title="Steps")
-            table.add_column("#", style="bold cyan", justify="right")
-            table.add_column("Step", style="bold")
-            for step in steps:
-                table.add_row(str(step["order"]), step["title"])
+            table = make_table(_CONTENT_COLUMNS, title="Steps")
+            for order, title, _ in steps:
+                table.add_row(str(order), title)
 
-            console.print(table)
-            console.print(f"\n[dim]Add --execute to run this plan[/dim]")
+            renderables += [table, "\n[dim]Add --execute to run this plan[/dim]"]
+        console.print(Group(*renderables))
 
 
 @marketing_app.command()
@@ -108,18 +110,16 @@ def campaign(
         error_panel("Campaign Error", result.get("message", "Engine not available"))
         return
 
-    console.print(Panel(
+    renderables: list[RenderableType] = [Panel(
         f"[bold]{result.get('name', '')}[/bold]\n{result.get('description', '')}",
         title=f"Campaign: {name}",
         border_style="magenta",
-    ))
+    )]
 
     steps = result.get("steps", [])
     if steps:
-        table = Table(title="Campaign Steps")
-        table.add_column("#", style="bold cyan", justify="right")
-        table.add_column("Action", style="bold")
-        table.add_column("Description", style="dim")
-        for step in steps:
-            table.add_row(str(step["order"]), step["title"], step["description"][:60])
-        console.print(table)
+        table = make_table(_CAMPAIGN_COLUMNS, title="Campaign Steps")
+        for order, title, description in steps:
+            table.add_row(str(order), title, description[:60])
+        renderables.append(table)
+    console.print(Group(*renderables))
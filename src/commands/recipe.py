@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import json
+import os
+import signal
 import subprocess
 from pathlib import Path
 from typing import List
@@ -10,18 +11,23 @@ from typing import List
 import typer
 from rich.table import Table
 
+from src.core import jsonx
 from src.core.console import console, success_panel, error_panel
 
 recipe_app = typer.Typer(help="Workflow recipe management")
 
+# Sidecar cache of per-recipe list metadata, keyed by file name and validated by mtime/size
+_INDEX_FILE = ".index.json"
+
+# Per-step time limit in seconds
+_STEP_TIMEOUT = 300
+
 
 def _recipes_dir() -> Path:
     """Return the recipes directory, creating it if needed."""
     from src.core.config import get_config
 
-    recipes_path = get_config().data_path / "recipes"
-    recipes_path.mkdir(parents=True, exist_ok=True)
-    return recipes_path
+    return get_config().recipes_dir
 
 
 def _load_recipe(name: str) -> dict:
@@ -31,20 +37,91 @@ def _load_recipe(name: str) -> dict:
         error_panel("Recipe Not Found", f"No recipe named '{name}' at {path}")
         raise typer.Exit(code=1)
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as exc:
+        data = jsonx.loads(path.read_bytes())
+    except (jsonx.JSONDecodeError, OSError) as exc:
         error_panel("Recipe Error", f"Failed to read '{name}': {exc}")
         raise typer.Exit(code=1)
     return data
 
 
+def _read_index(recipes_path: Path) -> dict[str, dict]:
+    """Load the recipe metadata index, or {} if missing/corrupt."""
+    try:
+        index = jsonx.loads((recipes_path / _INDEX_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _summarize(data: dict, fallback_name: str) -> dict:
+    """Reduce a parsed recipe to the metadata `recipe list` shows."""
+    steps: List[dict] = data.get("steps", [])
+    return {
+        "name": data.get("name", fallback_name),
+        "description": data.get("description", "-"),
+        "steps": len(steps),
+    }
+
+
+def _recipe_meta(path: str, fallback_name: str) -> dict:
+    """Parse the list metadata (name, description, step count) out of a recipe file."""
+    try:
+        with open(path, "rb") as f:
+            return _summarize(jsonx.loads(f.read()), fallback_name)
+    except (ValueError, OSError, AttributeError):
+        return {"invalid": True}
+
+
+def _index_recipe(recipes_path: Path, filepath: Path, data: dict) -> None:
+    """Record a just-written recipe in the index so `recipe list` need not parse it."""
+    try:
+        st = filepath.stat()
+        index = _read_index(recipes_path)
+        index[filepath.name] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            **_summarize(data, filepath.stem),
+        }
+        (recipes_path / _INDEX_FILE).write_bytes(jsonx.dumps_compact(index))
+    except OSError:
+        pass
+
+
 @recipe_app.command("list")
 def list_recipes():
     """List available recipes."""
     recipes_path = _recipes_dir()
-    files = sorted(recipes_path.glob("*.json"))
+    index = _read_index(recipes_path)
+    fresh: dict[str, dict] = {}
 
-    if not files:
+    with os.scandir(recipes_path) as it:
+        for entry in it:
+            # is_file() is answered from the directory entry type; only symlinks need a stat()
+            if (
+                not entry.name.endswith(".json")
+                or entry.name.startswith(".")
+                or not entry.is_file()
+            ):
+                continue
+            st = entry.stat()
+            cached = index.get(entry.name)
+            if (
+                cached
+                and cached.get("mtime_ns") == st.st_mtime_ns
+                and cached.get("size") == st.st_size
+            ):
+                fresh[entry.name] = cached
+            else:
+                meta = _recipe_meta(entry.path, entry.name[:-5])
+                fresh[entry.name] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, **meta}
+
+    if fresh != index:
+        try:
+            (recipes_path / _INDEX_FILE).write_bytes(jsonx.dumps_compact(fresh))
+        except OSError:
+            pass
+
+    if not fresh:
         console.print("[dim]No recipes found.[/dim] Create one with: mekon recipe create <name>")
         return
 
@@ -53,26 +130,159 @@ def list_recipes():
     table.add_column("Description")
     table.add_column("Steps", justify="right")
 
-    for fp in files:
-        try:
-            data = json.loads(fp.read_text(encoding="utf-8"))
-            steps: List[dict] = data.get("steps", [])
-            table.add_row(
-                data.get("name", fp.stem),
-                data.get("description", "-"),
-                str(len(steps)),
-            )
-        except (json.JSONDecodeError, OSError):
-            table.add_row(fp.stem, "[red]invalid json[/red]", "-")
+    for file_name in sorted(fresh):
+        meta = fresh[file_name]
+        if meta.get("invalid"):
+            table.add_row(file_name[:-5], "[red]invalid json[/red]", "-")
+        else:
+            table.add_row(meta["name"], meta["description"], str(meta["steps"]))
 
     console.print(table)
 
 
+def _start_step(command: str, new_session: bool = False) -> subprocess.Popen:
+    """Spawn a step's shell command.
+
+    Steps run in the foreground process group so Ctrl+C reaches them. Parallel
+    steps pass ``new_session`` so a failing sibling can kill each one as a group.
+    """
+    return subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=new_session,
+    )
+
+
+def _kill_step(proc: subprocess.Popen) -> None:
+    """Kill a step: its whole process group if it leads one, otherwise just the shell."""
+    try:
+        if hasattr(os, "killpg") and os.getpgid(proc.pid) == proc.pid:
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _abandon_step(proc: subprocess.Popen) -> None:
+    """Kill a step and reap it without reading its pipes.
+
+    A grandchild that outlived the kill may still hold the pipes open, so
+    waiting for EOF (communicate) could block until it exits.
+    """
+    _kill_step(proc)
+    proc.wait()
+    for pipe in (proc.stdout, proc.stderr):
+        if pipe is not None:
+            pipe.close()
+
+
+def _finish_step(proc: subprocess.Popen, timeout: float = _STEP_TIMEOUT) -> tuple[str, str]:
+    """Wait for a step. Return (outcome, stderr) with outcome "pass", "fail" or "timeout"."""
+    try:
+        _, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _abandon_step(proc)
+        return "timeout", ""
+    except BaseException:
+        # e.g. KeyboardInterrupt: don't leave the step running
+        _abandon_step(proc)
+        raise
+    return ("pass" if proc.returncode == 0 else "fail"), stderr or ""
+
+
+def _report_step(step_name: str, outcome: str, detail: str) -> None:
+    """Print the result line for one finished step."""
+    if outcome == "pass":
+        console.print(f"  [green]PASS[/green] {step_name}")
+    elif outcome == "fail":
+        console.print(f"  [red]FAIL[/red] {step_name}")
+        if detail:
+            console.print(f"    [dim]{detail.strip()[:200]}[/dim]")
+    elif outcome == "timeout":
+        console.print(f"  [red]TIMEOUT[/red] {step_name}")
+    elif outcome == "cancelled":
+        console.print(f"  [yellow]CANCELLED[/yellow] {step_name}")
+    else:
+        console.print(f"  [red]ERROR[/red] {step_name}: {detail}")
+
+
+def _batch_steps(steps: List[dict]) -> List[List[tuple[int, dict]]]:
+    """Split steps into batches: consecutive steps sharing a ``parallel_group`` run together."""
+    batches: List[List[tuple[int, dict]]] = []
+    prev_group = None
+    for idx, step in enumerate(steps, start=1):
+        group = step.get("parallel_group")
+        if group is not None and group == prev_group:
+            batches[-1].append((idx, step))
+        else:
+            batches.append([(idx, step)])
+        prev_group = group
+    return batches
+
+
+def _run_parallel(batch: List[tuple[int, dict]], total: int) -> dict[int, tuple[str, str]]:
+    """Run a parallel group concurrently. Return {step index: (outcome, detail)}.
+
+    When a step fails and its ``continue_on_error`` is false, still-running
+    siblings are killed and reported as cancelled. On interrupt every step is
+    killed before the exception propagates.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    results: dict[int, tuple[str, str]] = {}
+    procs: dict[int, subprocess.Popen] = {}
+    with Progress(
+        SpinnerColumn(), TextColumn("{task.description}"), console=console, transient=True,
+    ) as progress:
+        tasks = {}
+        for idx, step in batch:
+            step_name = step.get("name", f"Step {idx}")
+            try:
+                procs[idx] = _start_step(step.get("command", ""), new_session=True)
+            except OSError as exc:
+                results[idx] = ("error", str(exc))
+                continue
+            tasks[idx] = progress.add_task(f"[bold green]Running step {idx}/{total}: {step_name}")
+
+        steps_by_idx = dict(batch)
+        with ThreadPoolExecutor(max_workers=max(1, len(procs))) as pool:
+            futures = {pool.submit(_finish_step, proc): idx for idx, proc in procs.items()}
+            try:
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    progress.update(tasks[idx], visible=False)
+                    if idx in results:  # already cancelled by a failing sibling
+                        continue
+                    outcome, detail = future.result()
+                    results[idx] = (outcome, detail)
+                    if outcome != "pass" and not steps_by_idx[idx].get("continue_on_error", False):
+                        for other, proc in procs.items():
+                            # A sibling that already exited keeps its real outcome
+                            if other not in results and proc.poll() is None:
+                                results[other] = ("cancelled", "")
+                                _kill_step(proc)
+            except BaseException:
+                for proc in procs.values():
+                    _kill_step(proc)
+                raise
+    return results
+
+
 @recipe_app.command()
 def run(
     name: str = typer.Argument(..., help="Recipe name to execute"),
 ):
-    """Execute a recipe by running its steps sequentially."""
+    """Execute a recipe by running its steps in order.
+
+    Consecutive steps that share a ``"parallel_group"`` value run concurrently;
+    the next step starts once the whole group has finished.
+    """
     data = _load_recipe(name)
     steps: List[dict] = data.get("steps", [])
 
@@ -86,42 +296,35 @@ def run(
     passed = 0
     failed = 0
 
-    for idx, step in enumerate(steps, start=1):
-        step_name = step.get("name", f"Step {idx}")
-        command = step.get("command", "")
-        continue_on_error = step.get("continue_on_error", False)
+    for batch in _batch_steps(steps):
+        if len(batch) == 1:
+            idx, step = batch[0]
+            step_name = step.get("name", f"Step {idx}")
+            with console.status(f"[bold green]Running step {idx}/{len(steps)}: {step_name}"):
+                try:
+                    results = {idx: _finish_step(_start_step(step.get("command", "")))}
+                except OSError as exc:
+                    results = {idx: ("error", str(exc))}
+        else:
+            results = _run_parallel(batch, len(steps))
 
-        with console.status(f"[bold green]Running step {idx}/{len(steps)}: {step_name}"):
-            try:
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                )
-                if result.returncode == 0:
-                    console.print(f"  [green]PASS[/green] {step_name}")
-                    passed += 1
-                else:
-                    console.print(f"  [red]FAIL[/red] {step_name}")
-                    if result.stderr:
-                        console.print(f"    [dim]{result.stderr.strip()[:200]}[/dim]")
-                    failed += 1
-                    if not continue_on_error:
-                        console.print("[red]Stopping: continue_on_error is false.[/red]")
-                        break
-            except subprocess.TimeoutExpired:
-                console.print(f"  [red]TIMEOUT[/red] {step_name}")
+        stop_reason = None
+        for idx, step in batch:
+            outcome, detail = results[idx]
+            _report_step(step.get("name", f"Step {idx}"), outcome, detail)
+            if outcome == "pass":
+                passed += 1
+            elif outcome != "cancelled":
                 failed += 1
-                if not continue_on_error:
-                    console.print("[red]Stopping: step timed out.[/red]")
-                    break
-            except OSError as exc:
-                console.print(f"  [red]ERROR[/red] {step_name}: {exc}")
-                failed += 1
-                if not continue_on_error:
-                    break
+                if not step.get("continue_on_error", False) and stop_reason is None:
+                    stop_reason = outcome
+
+        if stop_reason == "fail":
+            console.print("[red]Stopping: continue_on_error is false.[/red]")
+        elif stop_reason == "timeout":
+            console.print("[red]Stopping: step timed out.[/red]")
+        if stop_reason is not None:
+            break
 
     # Summary
     console.print()
@@ -152,5 +355,6 @@ def create(
         ],
     }
 
-    filepath.write_text(json.dumps(template, indent=2) + "\n", encoding="utf-8")
+    filepath.write_bytes(jsonx.dumps_pretty(template))
+    _index_recipe(recipes_path, filepath, template)
     success_panel("Recipe Created", f"Template saved to {filepath}")
@@ -2,60 +2,71 @@
 
 from __future__ import annotations
 
-import json
+import csv
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
 import typer
+from rich.console import Group, RenderableType
 from rich.table import Table
 from rich.panel import Panel
 
-from src.core.console import console, info_panel, error_panel
+from src.core import jsonx
+from src.core.console import console, info_panel, error_panel, make_table
 from src.core.config import get_config
+from src.core.ledger_cache import (
+    add_to_aggregates,
+    append_entry,
+    ledger_path,
+    load_aggregates,
+    load_ledger,
+    month_total,
+    save_aggregates,
+)
 
 revenue_app = typer.Typer(help="Revenue: track payments, analytics, financial reports")
 
+_CSV_FIELDS = ["date", "source", "amount", "note"]
+
+_RECENT_COLUMNS = (
+    ("Date", {"style": "dim"}),
+    ("Source", {"style": "cyan"}),
+    ("Amount", {"style": "bold green", "justify": "right"}),
+    ("Note", {"style": "dim"}),
+)
+
 
 @revenue_app.command()
 def dashboard():
     """Show revenue dashboard overview."""
-    config = get_config()
-    data_path = config.ensure_data_dir() / "revenue"
-    data_path.mkdir(exist_ok=True)
-
-    ledger_file = data_path / "ledger.json"
-    entries = _load_ledger(ledger_file)
+    ledger_file = ledger_path(get_config().revenue_dir)
+    agg = load_aggregates(ledger_file)
 
-    total = sum(e.get("amount", 0) for e in entries)
-    this_month = sum(
-        e.get("amount", 0) for e in entries
-        if e.get("date", "").startswith(datetime.now().strftime("%Y-%m"))
-    )
+    total = agg["total"]
+    this_month = month_total(agg)
 
-    console.print(Panel(
+    # Collect the summary and table and print them in one render
+    renderables: list[RenderableType] = [Panel(
         f"[bold]Total Revenue:[/bold] ${total:,.2f}\n"
         f"[bold]This Month:[/bold] ${this_month:,.2f}\n"
-        f"[bold]Transactions:[/bold] {len(entries)}\n"
+        f"[bold]Transactions:[/bold] {agg['count']}\n"
         f"[bold]Data:[/bold] {ledger_file}",
         title="Revenue Dashboard",
         border_style="green",
-    ))
+    )]
 
-    if entries:
-        table = Table(title="Recent Transactions (last 10)")
-        table.add_column("Date", style="dim")
-        table.add_column("Source", style="cyan")
-        table.add_column("Amount", style="bold green", justify="right")
-        table.add_column("Note", style="dim")
-
-        for entry in entries[-10:]:
+    if agg["recent"]:
+        table = make_table(_RECENT_COLUMNS, title="Recent Transactions (last 10)")
+        for entry in agg["recent"][-10:]:
             table.add_row(
                 entry.get("date", "?"),
                 entry.get("source", "?"),
                 f"${entry.get('amount', 0):,.2f}",
                 entry.get("note", ""),
             )
-        console.print(table)
+        renderables.append(table)
+    console.print(Group(*renderables))
 
 
 @revenue_app.command()
@@ -65,12 +76,8 @@ def add(
     note: str = typer.Option("", "--note", "-n", help="Transaction note"),
 ):
     """Record a revenue transaction."""
-    config = get_config()
-    data_path = config.ensure_data_dir() / "revenue"
-    data_path.mkdir(exist_ok=True)
-
-    ledger_file = data_path / "ledger.json"
-    entries = _load_ledger(ledger_file)
+    ledger_file = ledger_path(get_config().revenue_dir)
+    agg = load_aggregates(ledger_file)
 
     entry = {
         "date": datetime.now().isoformat(),
@@ -78,8 +85,9 @@ def add(
         "source": source,
         "note": note,
     }
-    entries.append(entry)
-    _save_ledger(ledger_file, entries)
+    appended = append_entry(ledger_file, entry)
+    add_to_aggregates(agg, entry)
+    save_aggregates(ledger_file, agg, appended)
 
     console.print(f"[green]Recorded:[/green] ${amount:,.2f} from {source}")
 
@@ -89,10 +97,8 @@ def report(
     period: str = typer.Option("month", "--period", "-p", help="Report period: week, month, year"),
 ):
     """Generate revenue report for a period."""
-    config = get_config()
-    data_path = config.ensure_data_dir() / "revenue"
-    ledger_file = data_path / "ledger.json"
-    entries = _load_ledger(ledger_file)
+    ledger_file = ledger_path(get_config().revenue_dir)
+    entries = load_ledger(ledger_file)
 
     if not entries:
         console.print("[yellow]No transactions recorded yet.[/yellow]")
@@ -107,15 +113,16 @@ def report(
         cutoff = now.replace(day=1)
 
     cutoff_str = cutoff.isoformat()
-    filtered = [e for e in entries if e.get("date", "") >= cutoff_str]
-
-    total = sum(e.get("amount", 0) for e in filtered)
 
-    # Group by source
-    by_source: dict[str, float] = {}
-    for e in filtered:
-        src = e.get("source", "unknown")
-        by_source[src] = by_source.get(src, 0) + e.get("amount", 0)
+    # Filter, total and group by source in a single pass
+    total = 0.0
+    by_source: defaultdict[str, float] = defaultdict(float)
+    for e in entries:
+        if e.get("date", "") < cutoff_str:
+            continue
+        amt = e.get("amount", 0)
+        total += amt
+        by_source[e.get("source", "unknown")] += amt
 
     table = Table(title=f"Revenue Report ({period})")
     table.add_column("Source", style="cyan")
@@ -136,38 +143,25 @@ def export(
     output: str = typer.Option("revenue-export", "--output", "-o", help="Output filename"),
 ):
     """Export revenue data."""
-    config = get_config()
-    data_path = config.ensure_data_dir() / "revenue"
-    ledger_file = data_path / "ledger.json"
-    entries = _load_ledger(ledger_file)
+    ledger_file = ledger_path(get_config().revenue_dir)
+    entries = load_ledger(ledger_file)
 
     if not entries:
         console.print("[yellow]No data to export.[/yellow]")
         return
 
     if format == "json":
+        # One serializer call; the encoded document is held in memory until written
         out_file = Path(f"{output}.json")
-        out_file.write_text(json.dumps(entries, indent=2))
+        out_file.write_bytes(jsonx.dumps_pretty(entries))
     else:
+        # Stream rows straight to disk rather than building the whole file in memory
         out_file = Path(f"{output}.csv")
-        lines = ["date,source,amount,note"]
-        for e in entries:
-            lines.append(f"{e.get('date', '')},{e.get('source', '')},{e.get('amount', 0)},{e.get('note', '')}")
-        out_file.write_text("\n".join(lines))
+        with open(out_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.DictWriter(
+                f, fieldnames=_CSV_FIELDS, restval="", extrasaction="ignore", lineterminator="\n",
+            )
+            writer.writeheader()
+            writer.writerows(entries)
 
     console.print(f"[green]Exported {len(entries)} entries to {out_file}[/green]")
-
-
-def _load_ledger(path: Path) -> list[dict]:
-    """Load ledger from JSON file."""
-    if not path.exists():
-        return []
-    try:
-        return json.loads(path.read_text())
-    except (json.JSONDecodeError, ValueError):
-        return []
-
-
-def _save_ledger(path: Path, entries: list[dict]) -> None:
-    """Save ledger to JSON file."""
-    path.write_text(json.dumps(entries, indent=2))
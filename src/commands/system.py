@@ -1,5 +1,7 @@
 """System command group - config, health, version info."""
 
+from __future__ import annotations
+
 import typer
 from rich.panel import Panel
 from rich.table import Table
@@ -33,16 +35,16 @@ def config():
 @system_app.command()
 def health():
     """Run system health checks."""
-    import subprocess
+    from src.core.subproc import run_probes
 
     cfg = get_config()
 
     checks = [
-        ("Python", "python3 --version"),
-        ("Git", "git --version"),
-        ("Node", "node --version"),
-        ("Vercel", "vercel --version"),
-        ("Docker", "docker --version"),
+        ("Python", ["python3", "--version"]),
+        ("Git", ["git", "--version"]),
+        ("Node", ["node", "--version"]),
+        ("Vercel", ["vercel", "--version"]),
+        ("Docker", ["docker", "--version"]),
     ]
 
     table = Table(title="System Health")
@@ -50,19 +52,17 @@ def health():
     table.add_column("Status")
     table.add_column("Version", style="dim")
 
-    for name, cmd in checks:
-        try:
-            result = subprocess.run(
-                cmd.split(),
-                capture_output=True, text=True, timeout=5,
-            )
-            if result.returncode == 0:
-                version = result.stdout.strip().split("\n")[0]
-                table.add_row(name, "[green]OK[/green]", version)
-            else:
-                table.add_row(name, "[yellow]error[/yellow]", "")
-        except (FileNotFoundError, subprocess.TimeoutExpired):
+    # Probes are independent; run them concurrently so wall time is the slowest one
+    results = run_probes([cmd for _, cmd in checks], timeout=5)
+
+    for (name, _), result in zip(checks, results):
+        if result is None:
             table.add_row(name, "[dim]not found[/dim]", "")
+        elif result.returncode == 0:
+            version = result.stdout.strip().split("\n")[0]
+            table.add_row(name, "[green]OK[/green]", version)
+        else:
+            table.add_row(name, "[yellow]error[/yellow]", "")
 
     # Check mekong-cli
     mekong_ok = cfg.mekong_path.exists()
@@ -6,64 +6,65 @@ Collectors reuse logic from existing command modules where possible.
 
 from __future__ import annotations
 
-import json
-import subprocess
-from datetime import datetime
 from pathlib import Path
 
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
 
 from src.core.config import get_config
+from src.core.console import ColumnSpec, make_table
+from src.core.ledger_cache import ledger_path, load_aggregates, month_total
+
+# Borderless table style and column layouts shared by every refresh
+_PANEL_TABLE = {"show_header": True, "header_style": "bold", "expand": True, "box": None}
+_DEVOPS_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("Platform", {"style": "cyan"}),
+    ("Status", {}),
+    ("Info", {"style": "dim"}),
+)
+_SYSTEM_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("Tool", {"style": "cyan"}),
+    ("Status", {}),
+    ("Version", {"style": "dim"}),
+)
 
 
 def collect_devops() -> Panel:
     """Collect DevOps status: git branch, vercel, docker."""
+    from src.core.subproc import run_probes
+
     try:
-        table = Table(show_header=True, header_style="bold", expand=True, box=None)
-        table.add_column("Platform", style="cyan")
-        table.add_column("Status")
-        table.add_column("Info", style="dim")
+        table = make_table(_DEVOPS_COLUMNS, **_PANEL_TABLE)
+
+        branch, status, vercel, docker = run_probes([
+            ["git", "branch", "--show-current"],
+            ["git", "status", "--porcelain"],
+            ["vercel", "--version"],
+            ["docker", "info", "--format", "{{.ContainersRunning}}"],
+        ])
 
         # Git
-        try:
-            branch = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True, text=True, timeout=3,
-            )
-            status = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True, text=True, timeout=3,
-            )
+        if branch is not None and status is not None:
             clean = not status.stdout.strip()
             table.add_row(
                 "Git",
                 "[green]clean[/green]" if clean else "[yellow]dirty[/yellow]",
                 branch.stdout.strip(),
             )
-        except (FileNotFoundError, subprocess.TimeoutExpired):
+        else:
             table.add_row("Git", "[dim]n/a[/dim]", "")
 
         # Vercel
-        try:
-            result = subprocess.run(
-                ["vercel", "--version"],
-                capture_output=True, text=True, timeout=3,
-            )
-            table.add_row("Vercel", "[green]installed[/green]", result.stdout.strip()[:20])
-        except (FileNotFoundError, subprocess.TimeoutExpired):
+        if vercel is not None:
+            table.add_row("Vercel", "[green]installed[/green]", vercel.stdout.strip()[:20])
+        else:
             table.add_row("Vercel", "[dim]not found[/dim]", "")
 
         # Docker
-        try:
-            result = subprocess.run(
-                ["docker", "info", "--format", "{{.ContainersRunning}}"],
-                capture_output=True, text=True, timeout=3,
-            )
-            running = result.stdout.strip() if result.returncode == 0 else "?"
+        if docker is not None:
+            running = docker.stdout.strip() if docker.returncode == 0 else "?"
             table.add_row("Docker", "[green]running[/green]", f"{running} containers")
-        except (FileNotFoundError, subprocess.TimeoutExpired):
+        else:
             table.add_row("Docker", "[dim]not found[/dim]", "")
 
         return Panel(table, title="[1] DevOps", border_style="blue")
@@ -75,7 +76,7 @@ def collect_revenue() -> Panel:
     """Collect revenue summary from ledger."""
     try:
         config = get_config()
-        ledger_file = config.data_path / "revenue" / "ledger.json"
+        ledger_file = ledger_path(config.data_path / "revenue")
 
         if not ledger_file.exists():
             return Panel(
@@ -85,26 +86,21 @@ def collect_revenue() -> Panel:
                 border_style="green",
             )
 
-        entries = json.loads(ledger_file.read_text())
-        total = sum(e.get("amount", 0) for e in entries)
-        now = datetime.now()
-        month_entries = [
-            e for e in entries
-            if e.get("date", "").startswith(now.strftime("%Y-%m"))
-        ]
-        month_total = sum(e.get("amount", 0) for e in month_entries)
+        agg = load_aggregates(ledger_file)
+        total = agg["total"]
+        this_month = month_total(agg)
 
         # Last 3 transactions
         recent_lines = []
-        for e in entries[-3:]:
+        for e in agg["recent"][-3:]:
             amt = e.get("amount", 0)
             src = e.get("source", "?")
             recent_lines.append(f"  ${amt:,.0f} from {src}")
 
         content = (
             f"[bold]Total:[/bold]  ${total:,.2f}\n"
-            f"[bold]Month:[/bold]  ${month_total:,.2f}\n"
-            f"[bold]Txns:[/bold]   {len(entries)}\n"
+            f"[bold]Month:[/bold]  ${this_month:,.2f}\n"
+            f"[bold]Txns:[/bold]   {agg['count']}\n"
         )
         if recent_lines:
             content += "\n[dim]Recent:[/dim]\n" + "\n".join(recent_lines)
@@ -144,31 +140,26 @@ def collect_agents() -> Panel:
 
 def collect_system() -> Panel:
     """Collect system tool versions."""
+    from src.core.subproc import run_probes
+
     try:
-        table = Table(show_header=True, header_style="bold", expand=True, box=None)
-        table.add_column("Tool", style="cyan")
-        table.add_column("Status")
-        table.add_column("Version", style="dim")
+        table = make_table(_SYSTEM_COLUMNS, **_PANEL_TABLE)
 
         checks = [
-            ("Python", "python3 --version"),
-            ("Git", "git --version"),
-            ("Node", "node --version"),
+            ("Python", ["python3", "--version"]),
+            ("Git", ["git", "--version"]),
+            ("Node", ["node", "--version"]),
         ]
 
-        for name, cmd in checks:
-            try:
-                result = subprocess.run(
-                    cmd.split(),
-                    capture_output=True, text=True, timeout=3,
-                )
-                if result.returncode == 0:
-                    ver = result.stdout.strip().split("\n")[0]
-                    table.add_row(name, "[green]OK[/green]", ver[:25])
-                else:
-                    table.add_row(name, "[yellow]err[/yellow]", "")
-            except (FileNotFoundError, subprocess.TimeoutExpired):
+        results = run_probes([cmd for _, cmd in checks])
+        for (name, _), result in zip(checks, results):
+            if result is None:
                 table.add_row(name, "[dim]n/a[/dim]", "")
+            elif result.returncode == 0:
+                ver = result.stdout.strip().split("\n")[0]
+                table.add_row(name, "[green]OK[/green]", ver[:25])
+            else:
+                table.add_row(name, "[yellow]err[/yellow]", "")
 
         return Panel(table, title="[4] System", border_style="cyan")
     except Exception:
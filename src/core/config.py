@@ -1,47 +1,39 @@
-"""Configuration management for Mekon CLI."""
+"""Configuration management for Mekon CLI.
 
-import os
-from pathlib import Path
-from pydantic_settings import BaseSettings
-from pydantic import Field
+pydantic / pydantic-settings are imported on first use rather than at module
+import, so commands that never read settings (``--help``, ``version``) skip
+their import cost. ``MekonConfig`` is still importable from this module.
+"""
 
+from __future__ import annotations
 
-class MekonConfig(BaseSettings):
-    """Central configuration loaded from environment and .env file."""
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-    # LLM settings
-    llm_api_url: str = Field(default="https://api.openai.com/v1", alias="MEKON_LLM_API_URL")
-    llm_api_key: str = Field(default="", alias="MEKON_LLM_API_KEY")
-    llm_model: str = Field(default="gpt-4", alias="MEKON_LLM_MODEL")
+if TYPE_CHECKING:
+    from src.core.config_model import MekonConfig
 
-    # Mekong CLI integration path
-    mekong_cli_path: str = Field(default="../mekong-cli", alias="MEKONG_CLI_PATH")
 
-    # DevOps tokens
-    vercel_token: str = Field(default="", alias="VERCEL_TOKEN")
-    cloudflare_token: str = Field(default="", alias="CLOUDFLARE_TOKEN")
+def _config_class() -> type[MekonConfig]:
+    """Return the settings model (first call imports pydantic-settings)."""
+    from src.core.config_model import MekonConfig
 
-    # Data directory
-    data_dir: str = Field(default="~/.mekon", alias="MEKON_DATA_DIR")
+    return MekonConfig
 
-    model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
 
-    @property
-    def data_path(self) -> Path:
-        """Resolved data directory path."""
-        return Path(self.data_dir).expanduser()
+def __getattr__(name: str) -> Any:
+    """Resolve ``MekonConfig`` lazily (PEP 562)."""
+    if name == "MekonConfig":
+        return _config_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    @property
-    def mekong_path(self) -> Path:
-        """Resolved mekong-cli project path."""
-        return Path(self.mekong_cli_path).resolve()
 
-    def ensure_data_dir(self) -> Path:
-        """Create data directory if it doesn't exist."""
-        self.data_path.mkdir(parents=True, exist_ok=True)
-        return self.data_path
+@lru_cache(maxsize=1)
+def get_config() -> MekonConfig:
+    """Get the global configuration instance (parsed once per process)."""
+    return _config_class()()
 
 
-def get_config() -> MekonConfig:
-    """Get the global configuration instance."""
-    return MekonConfig()
+def invalidate_config() -> None:
+    """Drop the cached configuration so the next get_config() re-reads env and .env."""
+    get_config.cache_clear()
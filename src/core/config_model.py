@@ -0,0 +1,63 @@
+"""The Mekon settings model.
+
+Kept apart from ``config`` because importing it loads pydantic and
+pydantic-settings; ``config`` imports this module on first use.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class MekonConfig(BaseSettings):
+    """Central configuration loaded from environment and .env file."""
+
+    # LLM settings
+    llm_api_url: str = Field(default="https://api.openai.com/v1", alias="MEKON_LLM_API_URL")
+    llm_api_key: str = Field(default="", alias="MEKON_LLM_API_KEY")
+    llm_model: str = Field(default="gpt-4", alias="MEKON_LLM_MODEL")
+
+    # Mekong CLI integration path
+    mekong_cli_path: str = Field(default="../mekong-cli", alias="MEKONG_CLI_PATH")
+
+    # DevOps tokens
+    vercel_token: str = Field(default="", alias="VERCEL_TOKEN")
+    cloudflare_token: str = Field(default="", alias="CLOUDFLARE_TOKEN")
+
+    # Data directory
+    data_dir: str = Field(default="~/.mekon", alias="MEKON_DATA_DIR")
+
+    model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
+
+    @cached_property
+    def data_path(self) -> Path:
+        """Resolved data directory path."""
+        return Path(self.data_dir).expanduser()
+
+    @cached_property
+    def mekong_path(self) -> Path:
+        """Resolved mekong-cli project path."""
+        return Path(self.mekong_cli_path).resolve()
+
+    @cached_property
+    def revenue_dir(self) -> Path:
+        """Revenue data directory, created (with the data dir) on first access."""
+        path = self.data_path / "revenue"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @cached_property
+    def recipes_dir(self) -> Path:
+        """Recipes directory, created (with the data dir) on first access."""
+        path = self.data_path / "recipes"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def ensure_data_dir(self) -> Path:
+        """Create data directory if it doesn't exist."""
+        self.data_path.mkdir(parents=True, exist_ok=True)
+        return self.data_path
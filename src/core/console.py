@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -9,6 +11,9 @@ from rich.text import Text
 
 console = Console()
 
+# Column definition for make_table(): (header, Table.add_column keyword arguments)
+ColumnSpec = tuple[str, dict[str, Any]]
+
 
 def success_panel(title: str, message: str) -> None:
     """Display a success panel."""
@@ -33,3 +38,11 @@ def status_table(title: str, rows: list[dict[str, str]], columns: list[str]) ->
     for row in rows:
         table.add_row(*[row.get(col, "") for col in columns])
     console.print(table)
+
+
+def make_table(columns: tuple[ColumnSpec, ...], **table_kwargs: Any) -> Table:
+    """Build an empty Table with the given column definitions installed."""
+    table = Table(**table_kwargs)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import sys
-from pathlib import Path
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 from src.core.config import get_config
-from src.core.console import console, error_panel
+from src.core.console import error_panel
+
+# Fields of a planned step, in the order plan_goal() returns them
+_STEP_FIELDS = attrgetter("order", "title", "description")
+
+# Set once mekong-cli has been put on sys.path, so later calls skip the stat and list scan
+_PATH_INSERTED = False
 
 
 def _ensure_mekong_importable() -> bool:
     """Add mekong-cli to sys.path if available."""
+    global _PATH_INSERTED
+    if _PATH_INSERTED:
+        return True
+
     config = get_config()
     mekong_path = config.mekong_path
 
@@ -21,45 +32,64 @@ def _ensure_mekong_importable() -> bool:
     mekong_str = str(mekong_path)
     if mekong_str not in sys.path:
         sys.path.insert(0, mekong_str)
+    _PATH_INSERTED = True
     return True
 
 
+@lru_cache(maxsize=4)
+def _build_orchestrator(strict: bool, rollback: bool) -> Any:
+    """Construct a RecipeOrchestrator; raises ImportError, which is not cached."""
+    from src.core.llm_client import get_client
+    from src.core.orchestrator import RecipeOrchestrator
+
+    llm = get_client()
+    return RecipeOrchestrator(
+        llm_client=llm if llm.is_available else None,
+        strict_verification=strict,
+        enable_rollback=rollback,
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_planner() -> Any:
+    """Construct a RecipePlanner; raises ImportError, which is not cached."""
+    from src.core.llm_client import get_client
+    from src.core.planner import RecipePlanner
+
+    llm = get_client()
+    return RecipePlanner(llm_client=llm if llm.is_available else None)
+
+
 def get_orchestrator(strict: bool = True, rollback: bool = True) -> Any:
-    """Get a RecipeOrchestrator from mekong-cli if available."""
+    """Get a RecipeOrchestrator from mekong-cli if available (reused per strict/rollback)."""
     if not _ensure_mekong_importable():
         error_panel("Engine Error", "mekong-cli not found. Set MEKONG_CLI_PATH in .env")
         return None
 
     try:
-        from src.core.orchestrator import RecipeOrchestrator
-        from src.core.llm_client import get_client
-
-        llm = get_client()
-        return RecipeOrchestrator(
-            llm_client=llm if llm.is_available else None,
-            strict_verification=strict,
-            enable_rollback=rollback,
-        )
+        return _build_orchestrator(strict, rollback)
     except ImportError as e:
         error_panel("Import Error", f"Cannot import mekong-cli engine: {e}")
         return None
 
 
 def get_planner() -> Any:
-    """Get a RecipePlanner from mekong-cli if available."""
+    """Get a RecipePlanner from mekong-cli if available (reused across calls)."""
     if not _ensure_mekong_importable():
         return None
 
     try:
-        from src.core.planner import RecipePlanner
-        from src.core.llm_client import get_client
-
-        llm = get_client()
-        return RecipePlanner(llm_client=llm if llm.is_available else None)
+        return _build_planner()
     except ImportError:
         return None
 
 
+def reset_engine() -> None:
+    """Drop the cached orchestrators and planner so the next call rebuilds them."""
+    _build_orchestrator.cache_clear()
+    _build_planner.cache_clear()
+
+
 def run_goal(goal: str, strict: bool = True) -> dict[str, Any]:
     """Execute a goal through mekong-cli's Plan-Execute-Verify engine."""
     orchestrator = get_orchestrator(strict=strict)
@@ -77,7 +107,10 @@ def run_goal(goal: str, strict: bool = True) -> dict[str, Any]:
 
 
 def plan_goal(goal: str) -> dict[str, Any]:
-    """Plan a goal without execution."""
+    """Plan a goal without execution.
+
+    ``steps`` is a list of ``(order, title, description)`` tuples.
+    """
     planner = get_planner()
     if not planner:
         return {"status": "error", "message": "Planner not available"}
@@ -86,8 +119,5 @@ def plan_goal(goal: str) -> dict[str, Any]:
     return {
         "name": recipe.name,
         "description": recipe.description,
-        "steps": [
-            {"order": s.order, "title": s.title, "description": s.description}
-            for s in recipe.steps
-        ],
+        "steps": list(map(_STEP_FIELDS, recipe.steps)),
     }
@@ -0,0 +1,50 @@
+"""JSON (de)serialization with orjson when installed, stdlib json otherwise.
+
+All helpers work in bytes so callers can use ``Path.read_bytes()`` /
+``Path.write_bytes()`` and skip a separate UTF-8 encode/decode step.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "json" extra
+    orjson = None  # type: ignore[assignment]
+
+# Raised by loads() on malformed input for either backend (orjson's error subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def loads_lines(lines: Iterable[bytes]) -> list[Any]:
+    """Parse a sequence of non-empty JSON lines (NDJSON records) into a list.
+
+    orjson parses each line directly; the stdlib backend parses them as one
+    array instead, which avoids per-call overhead and is several times faster.
+    """
+    if orjson is not None:
+        return [orjson.loads(line) for line in lines]
+    return json.loads(b"[" + b",".join(lines) + b"]")
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON indented by two spaces, with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,186 @@
+"""Revenue ledger storage and caches.
+
+The ledger is NDJSON (``ledger.jsonl``, one transaction per line), so recording
+a transaction is a single append instead of rewriting the whole file. A legacy
+``ledger.json`` array is converted once, the first time the ledger is located.
+
+- Parsed ledgers are kept per process, keyed by file mtime and size: the dashboard
+  re-renders the revenue panel on every refresh, and an unchanged ledger is
+  parsed once with every later load costing a single stat().
+- Running totals live in an ``aggregates.json`` sidecar next to the ledger, kept
+  up to date by ``revenue add``, so summaries never need to parse the full ledger.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+from src.core import jsonx
+
+# path -> (st_mtime_ns, st_size, parsed entries)
+_CACHE: dict[Path, tuple[int, int, list[dict]]] = {}
+
+LEDGER_FILE = "ledger.jsonl"
+_LEGACY_LEDGER_FILE = "ledger.json"
+_AGGREGATES_FILE = "aggregates.json"
+
+# Most recent transactions kept in the aggregates sidecar
+_RECENT = 10
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to a temp file beside ``path``, fsync it, then rename it into place.
+
+    Readers see either the old file or the complete new one, never a truncated write.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def ledger_path(revenue_dir: Path) -> Path:
+    """Return the ledger file in ``revenue_dir``, migrating a legacy JSON array if present.
+
+    The legacy file is kept as ``ledger.json.bak`` after conversion.
+    """
+    path = revenue_dir / LEDGER_FILE
+    legacy = revenue_dir / _LEGACY_LEDGER_FILE
+    if path.exists() or not legacy.exists():
+        return path
+    try:
+        entries = jsonx.loads(legacy.read_bytes())
+    except (OSError, ValueError):
+        return path
+    if isinstance(entries, list):
+        _write_atomic(path, b"".join(jsonx.dumps_compact(e) + b"\n" for e in entries))
+        legacy.replace(legacy.with_name(_LEGACY_LEDGER_FILE + ".bak"))
+    return path
+
+
+def _parse_ndjson(data: bytes) -> list[dict]:
+    """Parse NDJSON, skipping blank and malformed lines (e.g. a torn final write)."""
+    entries = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entries.append(jsonx.loads(line))
+        except ValueError:
+            continue
+    return entries
+
+
+def load_ledger(path: Path) -> list[dict]:
+    """Load ledger entries from an NDJSON file, reusing the last parse if the file is unchanged.
+
+    Returns [] if the file is missing. The returned list is shared with the
+    cache: callers must not mutate it.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _CACHE.pop(path, None)
+        return []
+
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    try:
+        entries = _parse_ndjson(path.read_bytes())
+    except OSError:
+        return []
+    _CACHE[path] = (st.st_mtime_ns, st.st_size, entries)
+    return entries
+
+
+def append_entry(path: Path, entry: dict) -> int:
+    """Append one transaction to the ledger. Returns the number of bytes written."""
+    data = jsonx.dumps_compact(entry) + b"\n"
+    with open(path, "a+b") as f:
+        # Start on a fresh line if the file was left without a trailing newline
+        if f.tell():
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
+    return len(data)
+
+
+def _aggregate(entries: list[dict]) -> dict:
+    """Compute aggregates from scratch for a list of ledger entries."""
+    agg: dict = {"total": 0.0, "count": 0, "by_month": {}, "by_source": {}, "recent": []}
+    for entry in entries:
+        add_to_aggregates(agg, entry)
+    return agg
+
+
+def add_to_aggregates(agg: dict, entry: dict) -> None:
+    """Fold one new ledger entry into ``agg`` in place."""
+    amount = entry.get("amount", 0)
+    month = entry.get("date", "")[:7]
+    source = entry.get("source", "unknown")
+    agg["total"] += amount
+    agg["count"] += 1
+    agg["by_month"][month] = agg["by_month"].get(month, 0.0) + amount
+    agg["by_source"][source] = agg["by_source"].get(source, 0.0) + amount
+    agg["recent"] = (agg["recent"] + [entry])[-_RECENT:]
+
+
+def month_total(agg: dict, when: datetime | None = None) -> float:
+    """Revenue for the calendar month of ``when`` (default: now), from ``by_month``."""
+    return float(agg["by_month"].get((when or datetime.now()).strftime("%Y-%m"), 0.0))
+
+
+def save_aggregates(ledger_path: Path, agg: dict, appended: int | None = None) -> None:
+    """Write the aggregates sidecar, stamped with the ledger's current mtime/size.
+
+    Pass ``appended`` (bytes this process added with append_entry) when ``agg``
+    was loaded before that append. If the ledger grew by anything more, another
+    writer got in between and the aggregates are rebuilt from the ledger instead.
+    """
+    try:
+        st = ledger_path.stat()
+        if appended is not None and st.st_size != agg.get("ledger_size", 0) + appended:
+            agg = _aggregate(load_ledger(ledger_path))
+        agg["ledger_mtime_ns"] = st.st_mtime_ns
+        agg["ledger_size"] = st.st_size
+        _write_atomic(ledger_path.parent / _AGGREGATES_FILE, jsonx.dumps_compact(agg))
+    except OSError:
+        pass
+
+
+def load_aggregates(ledger_path: Path) -> dict:
+    """Return ledger aggregates: total, count, by_month, by_source and recent entries.
+
+    Served from the sidecar when it matches the ledger's mtime/size; otherwise
+    rebuilt from the full ledger and re-saved.
+    """
+    try:
+        st = ledger_path.stat()
+    except FileNotFoundError:
+        return _aggregate([])
+
+    try:
+        agg = jsonx.loads((ledger_path.parent / _AGGREGATES_FILE).read_bytes())
+    except (OSError, ValueError):
+        agg = None
+    if (
+        isinstance(agg, dict)
+        and agg.get("ledger_mtime_ns") == st.st_mtime_ns
+        and agg.get("ledger_size") == st.st_size
+    ):
+        return agg
+
+    agg = _aggregate(load_ledger(ledger_path))
+    save_aggregates(ledger_path, agg)
+    return agg
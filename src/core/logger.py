@@ -2,51 +2,194 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import atexit
+import os
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 
+from src.core import jsonx
 from src.core.config import get_config
 
+# Initial read size when scanning the log backwards from EOF; doubles each step
+_TAIL_CHUNK = 4096
+
+# Read size when counting entries in clear()
+_COUNT_CHUNK = 1 << 20
+
+# Buffered entries are flushed to disk after this many writes (errors flush at once)
+_FLUSH_EVERY = 32
+
+
+# (epoch second, formatted "%Y-%m-%dT%H:%M:%S" for it); replaced as one tuple, so thread-safe
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    """Local time as ISO 8601 with microseconds, like ``datetime.now().isoformat()``.
+
+    The date/time part is formatted once per second and reused for every entry
+    logged within that second.
+    """
+    global _ts_cache
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{int((now - sec) * 1_000_000):06d}"
+
+
+def _tail_lines(path: Path, limit: int) -> list[bytes]:
+    """Return the last ``limit`` non-empty lines of a file, reading backwards from EOF.
+
+    Cost is proportional to the size of the tail, not of the whole file.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        newlines = 0
+        chunk = _TAIL_CHUNK
+        while True:
+            # Only split once the (C-level) newline count says enough lines may be buffered
+            if pos == 0 or newlines > limit:
+                pieces = buf.split(b"\n")
+                if pos > 0:
+                    pieces = pieces[1:]  # first piece may be a partial line
+                lines = [line for line in pieces if line.strip()]
+                if pos == 0 or len(lines) >= limit:
+                    return lines[-limit:]
+            step = min(chunk, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step)
+            newlines += data.count(b"\n")
+            buf = data + buf
+            chunk *= 2
+
+
+def _count_lines(path: Path) -> int:
+    """Count lines (one per entry) by scanning fixed-size chunks; memory stays O(1)."""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        while chunk := f.read(_COUNT_CHUNK):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        count += 1  # final entry without a trailing newline
+    return count
+
 
 class ActivityLogger:
     """Log mekon CLI activity to ~/.mekon/logs/activity.jsonl"""
 
+    __slots__ = ("log_dir", "log_file", "_fd", "_pending", "_lock")
+
     def __init__(self) -> None:
         config = get_config()
         self.log_dir: Path = config.data_path / "logs"
         self.log_file: Path = self.log_dir / "activity.jsonl"
+        self._fd: Optional[int] = None
+        self._pending: list[bytes] = []
+        self._lock = threading.Lock()
+        # Buffered entries are written out at exit even if no flush ever happened
+        atexit.register(self.close)
+
+    def _open_fd(self) -> int:
+        """Open the log for appending, creating the log directory only if it is missing."""
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            return os.open(self.log_file, flags, 0o644)
+        except FileNotFoundError:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            return os.open(self.log_file, flags, 0o644)
+
+    def _write_pending(self) -> None:
+        """Append buffered entries in one write to the O_APPEND log fd (call with the lock held).
+
+        The descriptor is opened on first use and kept open. A single append write
+        keeps entries from concurrent mekon processes from interleaving mid-line.
+        """
+        if not self._pending:
+            return
+        if self._fd is None:
+            self._fd = self._open_fd()
+        data = memoryview(b"".join(self._pending))
+        self._pending.clear()
+        while data:
+            data = data[os.write(self._fd, data):]
 
     def log(self, action: str, details: str = "", status: str = "ok") -> None:
-        """Append a single log entry."""
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        """Append a single log entry.
+
+        Entries are buffered in memory and appended to the log file every
+        ``_FLUSH_EVERY`` entries, on a non-"ok" status, on flush()/close()
+        and at interpreter exit.
+        """
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "action": action,
             "details": details,
             "status": status,
         }
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        line = jsonx.dumps_compact(entry) + b"\n"
+        with self._lock:
+            self._pending.append(line)
+            if status != "ok" or len(self._pending) >= _FLUSH_EVERY:
+                self._write_pending()
+
+    def flush(self) -> None:
+        """Write any buffered entries to disk."""
+        with self._lock:
+            self._write_pending()
+
+    def close(self) -> None:
+        """Flush buffered entries and close the log file descriptor."""
+        with self._lock:
+            self._write_pending()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
 
     def read(self, limit: int = 50) -> list[dict[str, str]]:
         """Read last N log entries."""
-        if not self.log_file.exists():
+        self.flush()
+        try:
+            if limit <= 0:
+                lines = [line for line in self.log_file.read_bytes().splitlines() if line.strip()]
+            else:
+                lines = _tail_lines(self.log_file, limit)
+        except FileNotFoundError:
             return []
-        lines = self.log_file.read_text().strip().split("\n")
-        entries = [json.loads(line) for line in lines if line.strip()]
-        return entries[-limit:]
+        return jsonx.loads_lines(lines)
 
     def clear(self) -> int:
         """Clear all logs. Returns count of entries cleared."""
-        if not self.log_file.exists():
+        self.close()
+        try:
+            count = _count_lines(self.log_file)
+        except FileNotFoundError:
             return 0
-        lines = self.log_file.read_text().strip().split("\n")
-        count = len([line for line in lines if line.strip()])
-        self.log_file.unlink()
+        self.log_file.unlink(missing_ok=True)
         return count
 
 
+_logger: Optional[ActivityLogger] = None
+_logger_lock = threading.Lock()
+
+
 def get_logger() -> ActivityLogger:
-    """Get a new ActivityLogger instance."""
-    return ActivityLogger()
+    """Get the shared ActivityLogger instance (one per process, so writes share a buffer).
+
+    Safe to call from any thread: the instance is created exactly once, and
+    ActivityLogger serializes its own writes.
+    """
+    global _logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                _logger = ActivityLogger()
+    return _logger
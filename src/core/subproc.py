@@ -0,0 +1,60 @@
+"""Concurrent subprocess probes for health checks, dashboard collectors and status checks.
+
+All commands of a batch are spawned from one asyncio event loop and awaited
+together, so a batch costs about as long as its slowest command. Timeouts are
+enforced by the event loop, not per-call waits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+# One timeout for the whole batch, or one per command
+Timeouts = Union[float, Sequence[float]]
+
+
+async def _run_one(
+    cmd: list[str], timeout: float, cwd: Optional[Path] = None,
+) -> Optional[subprocess.CompletedProcess]:
+    """Run a single command; None if the executable (or cwd) is missing or it times out."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd,
+        )
+    except FileNotFoundError:
+        return None
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    return subprocess.CompletedProcess(
+        cmd,
+        await proc.wait(),  # already exited; returns the exit code as an int
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+async def run_many(
+    cmds: list[list[str]], timeout: Timeouts, cwd: Optional[Path] = None,
+) -> list[Optional[subprocess.CompletedProcess]]:
+    """Run commands concurrently and return their results in input order.
+
+    Output is decoded text, as with ``subprocess.run(..., text=True)``.
+    """
+    timeouts = [timeout] * len(cmds) if isinstance(timeout, (int, float)) else timeout
+    return list(await asyncio.gather(
+        *(_run_one(cmd, limit, cwd) for cmd, limit in zip(cmds, timeouts))
+    ))
+
+
+def run_probes(
+    cmds: list[list[str]], timeout: Timeouts = 3, cwd: Optional[Path] = None,
+) -> list[Optional[subprocess.CompletedProcess]]:
+    """Synchronous entry point for run_many()."""
+    return asyncio.run(run_many(cmds, timeout, cwd))
@@ -0,0 +1,20 @@
+"""Shared thread pool for short concurrent I/O (dashboard collectors, market lookups)."""
+
+from __future__ import annotations
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_executor() -> ThreadPoolExecutor:
+    """Shared worker pool, created on first use.
+
+    The work submitted here mostly waits on subprocesses, disk or the network,
+    so callers run it concurrently on this pool rather than spinning up a new
+    executor each time (e.g. on every dashboard refresh).
+    """
+    executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mekon-worker")
+    atexit.register(executor.shutdown, wait=False, cancel_futures=True)
+    return executor
@@ -4,21 +4,64 @@ Covers: DevOps, Revenue, Marketing, AI Agents.
 Powered by mekong-cli's Plan-Execute-Verify engine.
 """
 
-import typer
-from rich.panel import Panel
-from rich.text import Text
-
-from src.core.console import console
-from src.commands.devops import devops_app
-from src.commands.revenue import revenue_app
-from src.commands.marketing import marketing_app
-from src.commands.agents import agents_app
-from src.commands.system import system_app
-from src.commands.market import market_app
-from src.commands.logs import logs_app
-from src.commands.recipe import recipe_app
-from src.commands.dashboard import dash
-from src.commands.init_cmd import init_cmd
+from __future__ import annotations
+
+import os
+import sys
+
+
+def _print_version() -> None:
+    """Print the version panel."""
+    from rich.panel import Panel
+
+    from src import __version__
+    from src.core.console import console
+
+    console.print(Panel(
+        f"[bold green]Mekon CLI[/bold green] v{__version__}\n"
+        "[dim]All-in-one CLI for the Mekong ecosystem[/dim]",
+        title="Version",
+        border_style="blue",
+    ))
+
+
+def _invoked_as_cli(argv: list[str]) -> bool:
+    """True when this process is the CLI itself (``mekon`` or ``python -m src.main``).
+
+    Code that merely imports this module (tests, other tools) has its own argv,
+    which must not drive the CLI's startup shortcuts.
+    """
+    return bool(argv) and os.path.splitext(os.path.basename(argv[0]))[0] in ("mekon", "main")
+
+
+def _version_fast_path(argv: list[str]) -> bool:
+    """Answer ``mekon version`` / ``--version`` / ``-V`` before typer and the commands load.
+
+    Returns True if handled. Only applies when running as the CLI itself, never
+    when this module is imported by other code.
+    """
+    if len(argv) != 2 or argv[1] not in ("version", "--version", "-V"):
+        return False
+    if not _invoked_as_cli(argv):
+        return False
+    if argv[1] == "version":
+        _print_version()
+    else:
+        from src import __version__
+
+        sys.stdout.write(f"Mekon CLI v{__version__}\n")
+    return True
+
+
+if _version_fast_path(sys.argv):
+    sys.exit(0)
+
+# Imported only after the fast path above, which must not pay for them
+import importlib  # noqa: E402
+from typing import Any  # noqa: E402
+
+import typer  # noqa: E402
+from typer.core import TyperGroup  # noqa: E402
 
 app = typer.Typer(
     name="mekon",
@@ -26,38 +69,120 @@ app = typer.Typer(
     add_completion=False,
 )
 
-# Register domain sub-apps
-app.add_typer(devops_app, name="devops", help="DevOps: deploy, build, monitor")
-app.add_typer(revenue_app, name="revenue", help="Revenue: payments, analytics, reports")
-app.add_typer(marketing_app, name="marketing", help="Marketing: leads, content, campaigns")
-app.add_typer(agents_app, name="agents", help="Agents: AI orchestration, LLM management")
-app.add_typer(system_app, name="system", help="System: config, health, info")
-app.add_typer(market_app, name="market", help="Market: research, analyze, competitors")
-app.add_typer(logs_app, name="logs", help="Logs: activity tracking")
-app.add_typer(recipe_app, name="recipe", help="Recipe: workflow automation")
+# Domain sub-apps: name -> (module, Typer app attribute, help)
+_SUB_APPS: dict[str, tuple[str, str, str]] = {
+    "devops": ("src.commands.devops", "devops_app", "DevOps: deploy, build, monitor"),
+    "revenue": ("src.commands.revenue", "revenue_app", "Revenue: payments, analytics, reports"),
+    "marketing": (
+        "src.commands.marketing", "marketing_app", "Marketing: leads, content, campaigns",
+    ),
+    "agents": ("src.commands.agents", "agents_app", "Agents: AI orchestration, LLM management"),
+    "system": ("src.commands.system", "system_app", "System: config, health, info"),
+    "market": ("src.commands.market", "market_app", "Market: research, analyze, competitors"),
+    "logs": ("src.commands.logs", "logs_app", "Logs: activity tracking"),
+    "recipe": ("src.commands.recipe", "recipe_app", "Recipe: workflow automation"),
+}
+
+# Standalone commands: name -> (module, function attribute, help shown in the command list)
+_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "dash": ("src.commands.dashboard", "dash", "Launch interactive terminal dashboard."),
+    "init": (
+        "src.commands.init_cmd",
+        "init_cmd",
+        "Initialize a new Mekon project: .env, data dirs, mekong-cli detection.",
+    ),
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the first non-option argument, i.e. the command being invoked."""
+    return next((arg for arg in argv if not arg.startswith("-")), None)
 
-# Register standalone commands
-app.command(name="dash")(dash)
-app.command(name="init")(init_cmd)
+
+def _commands_to_load(argv: list[str]) -> set[str]:
+    """Names of the commands whose modules this invocation must import.
+
+    ``mekon <command> ...`` needs only that command and ``mekon --help`` needs
+    none. Anything else (no command, an unknown one, or an argv that is not
+    ours because the app was imported, e.g. by tests) loads everything.
+    """
+    everything = set(_SUB_APPS) | set(_COMMANDS)
+    if not _invoked_as_cli(argv):
+        return everything
+    sub = _sniff_subcommand(argv[1:])
+    if sub in _SUB_APPS or sub in _COMMANDS:
+        return {sub}
+    if sub is None and "--help" in argv:
+        return set()
+    return everything
+
+
+def _not_loaded(ctx: typer.Context) -> None:
+    """Placeholder for a command this invocation was not expected to run; only its help is shown.
+
+    Running it means the argv sniffing guessed wrong, so fail instead of doing nothing.
+    """
+    typer.echo(f"Error: command '{ctx.info_name}' was not loaded for this invocation.", err=True)
+    raise typer.Exit(code=2)
+
+
+class _NotLoadedGroup(TyperGroup):
+    """Placeholder sub-app: running any of its subcommands fails like _not_loaded()."""
+
+    def resolve_command(self, ctx: Any, args: list[str]) -> Any:
+        _not_loaded(ctx)
+
+
+# Command objects importable from this module: attribute -> defining module
+_LAZY_ATTRS: dict[str, str] = {
+    attr: module for module, attr, _ in (*_SUB_APPS.values(), *_COMMANDS.values())
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve command objects (``devops_app``, ``dash``, ...) on first access (PEP 562)."""
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+# Register commands; the ones not invoked get placeholders carrying just their help text
+_load = _commands_to_load(sys.argv)
+for _name, (_, _attr, _help) in _SUB_APPS.items():
+    if _name in _load:
+        app.add_typer(__getattr__(_attr), name=_name, help=_help)
+    else:
+        app.add_typer(
+            typer.Typer(cls=_NotLoadedGroup, callback=_not_loaded, invoke_without_command=True),
+            name=_name,
+            help=_help,
+        )
+for _name, (_, _attr, _help) in _COMMANDS.items():
+    if _name in _load:
+        app.command(name=_name)(__getattr__(_attr))
+    else:
+        app.command(name=_name, help=_help)(_not_loaded)
 
 
 @app.command()
 def version():
     """Show version info."""
-    from src import __version__
-
-    console.print(Panel(
-        f"[bold green]Mekon CLI[/bold green] v{__version__}\n"
-        "[dim]All-in-one CLI for the Mekong ecosystem[/dim]",
-        title="Version",
-        border_style="blue",
-    ))
+    _print_version()
 
 
 @app.callback(invoke_without_command=True)
 def main(ctx: typer.Context):
     """Mekon CLI: All-in-one toolkit for the Mekong ecosystem."""
     if ctx.invoked_subcommand is None:
+        # Only the bare `mekon` overview needs these; subcommands skip the import
+        from rich.panel import Panel
+        from rich.text import Text
+
+        from src.core.console import console
+
         console.print(Panel(
             Text("Mekon CLI", style="bold green"),
             subtitle="All-in-one toolkit for the Mekong ecosystem",
@@ -0,0 +1,52 @@
+"""Tests for devops command helpers."""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.commands.devops import _parse_git, _run_tail
+
+
+def test_run_tail_survives_undecodable_output():
+    """Non-UTF-8 output is replaced, not fatal, so the pipe keeps draining."""
+    code = (
+        "import sys; sys.stdout.buffer.write(b'\\xff\\n' + b'x' * (1 << 20) + b'\\ndone\\n')"
+    )
+    returncode, out, _ = _run_tail([sys.executable, "-c", code], timeout=30)
+    assert returncode == 0
+    assert out.endswith("done\n")
+
+
+def test_run_tail_timeout_kills_child_processes():
+    """On timeout the whole process group dies, so a grandchild holding the pipes can't stall it."""
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_tail(["sh", "-c", "sleep 30; echo hi"], timeout=1)
+    assert time.monotonic() - started < 10
+
+
+def _git(stdout, returncode=0):
+    return subprocess.CompletedProcess(["git"], returncode, stdout, "")
+
+
+@pytest.mark.parametrize(
+    ("stdout", "status"),
+    [
+        ("# branch.oid abc\n# branch.head main\n", "clean"),
+        ("# branch.head main\n1 .M N... 100644 100644 100644 a b src/x.py\n", "dirty"),
+        ("# branch.head main\n? new.txt\n", "dirty"),
+    ],
+)
+def test_parse_git(stdout, status):
+    """Branch comes from the header; any non-header line means a dirty tree."""
+    parsed = _parse_git(_git(stdout))
+    assert parsed["branch"] == "main"
+    assert status in parsed["status"]
+
+
+@pytest.mark.parametrize("result", [None, _git("", returncode=128)])
+def test_parse_git_not_a_repo(result):
+    """A missing git or a failed status means no repository."""
+    assert "not a git repo" in _parse_git(result)["status"]
@@ -0,0 +1,83 @@
+"""Tests for revenue ledger storage and the aggregates sidecar."""
+
+import json
+
+from src.core.ledger_cache import (
+    add_to_aggregates,
+    append_entry,
+    ledger_path,
+    load_aggregates,
+    load_ledger,
+    save_aggregates,
+)
+
+
+def _entry(amount, source="client", date="2026-01-15T10:00:00"):
+    return {"date": date, "amount": amount, "source": source, "note": ""}
+
+
+def test_legacy_array_is_migrated_once(tmp_path):
+    """A legacy ledger.json array becomes ledger.jsonl and the original is kept as .bak."""
+    entries = [_entry(10), _entry(20, "shop")]
+    (tmp_path / "ledger.json").write_text(json.dumps(entries))
+
+    path = ledger_path(tmp_path)
+
+    assert path == tmp_path / "ledger.jsonl"
+    assert load_ledger(path) == entries
+    assert not (tmp_path / "ledger.json").exists()
+    assert json.loads((tmp_path / "ledger.json.bak").read_text()) == entries
+    assert ledger_path(tmp_path) == path
+
+
+def test_blank_and_torn_lines_are_skipped(tmp_path):
+    """Blank lines and a truncated final record do not break loading."""
+    path = tmp_path / "ledger.jsonl"
+    path.write_text(
+        json.dumps(_entry(10)) + "\n\n" + json.dumps(_entry(20)) + "\n" + '{"date": "2026-01'
+    )
+    assert [e["amount"] for e in load_ledger(path)] == [10, 20]
+
+
+def test_append_after_missing_trailing_newline(tmp_path):
+    """Appending to a file without a trailing newline starts the entry on a new line."""
+    path = tmp_path / "ledger.jsonl"
+    path.write_text(json.dumps(_entry(10)))
+
+    append_entry(path, _entry(20))
+
+    assert path.read_text().endswith("\n")
+    assert [e["amount"] for e in load_ledger(path)] == [10, 20]
+
+
+def test_sidecar_rebuilt_after_out_of_band_edit(tmp_path):
+    """Editing the ledger outside `revenue add` invalidates the aggregates sidecar."""
+    path = tmp_path / "ledger.jsonl"
+    append_entry(path, _entry(10))
+    assert load_aggregates(path)["total"] == 10
+
+    path.write_text(json.dumps(_entry(10)) + "\n" + json.dumps(_entry(250.5, "shop")) + "\n")
+
+    agg = load_aggregates(path)
+    assert agg["total"] == 260.5
+    assert agg["count"] == 2
+    assert agg["by_source"] == {"client": 10, "shop": 250.5}
+
+
+def test_concurrent_append_rebuilds_sidecar(tmp_path):
+    """An entry appended by another writer after our load still ends up in the sidecar."""
+    path = tmp_path / "ledger.jsonl"
+    append_entry(path, _entry(10))
+    agg = load_aggregates(path)
+
+    # Another process records a transaction between our load and our append
+    append_entry(path, _entry(5, "other"))
+
+    mine = _entry(100)
+    appended = append_entry(path, mine)
+    add_to_aggregates(agg, mine)
+    save_aggregates(path, agg, appended)
+
+    agg = load_aggregates(path)
+    assert agg["total"] == 115
+    assert agg["count"] == 3
@@ -0,0 +1,115 @@
+"""Tests for the activity logger."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.core.config import invalidate_config
+from src.core.logger import _FLUSH_EVERY, ActivityLogger, _count_lines, _tail_lines
+
+
+def test_buffered_entries_written_at_exit(tmp_path):
+    """An entry logged below the flush threshold still reaches disk when the process exits."""
+    code = "from src.core.logger import get_logger; get_logger().log('x', 'y')"
+    env = {**os.environ, "MEKON_DATA_DIR": str(tmp_path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=60, env=env,
+    )
+    assert result.returncode == 0, result.stderr
+
+    lines = (tmp_path / "logs" / "activity.jsonl").read_text().splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert (entry["action"], entry["details"], entry["status"]) == ("x", "y", "ok")
+
+
+@pytest.fixture
+def logger(tmp_path, monkeypatch):
+    """A fresh ActivityLogger writing under tmp_path."""
+    monkeypatch.setenv("MEKON_DATA_DIR", str(tmp_path))
+    invalidate_config()
+    activity = ActivityLogger()
+    yield activity
+    activity.close()
+    invalidate_config()
+
+
+class TestTailLines:
+    """Test the backwards tail reader."""
+
+    def test_skips_blank_lines(self, tmp_path):
+        path = tmp_path / "log"
+        path.write_bytes(b"a\n\n\nb\n\nc\n\n")
+        assert _tail_lines(path, 2) == [b"b", b"c"]
+
+    def test_no_trailing_newline(self, tmp_path):
+        path = tmp_path / "log"
+        path.write_bytes(b"a\nb\nc")
+        assert _tail_lines(path, 2) == [b"b", b"c"]
+
+    def test_limit_larger_than_file(self, tmp_path):
+        path = tmp_path / "log"
+        path.write_bytes(b"a\nb\n")
+        assert _tail_lines(path, 50) == [b"a", b"b"]
+
+    def test_spans_several_chunks(self, tmp_path):
+        """Lines straddling read-chunk boundaries come back whole."""
+        lines = [f"line-{i:05d}-".encode() + b"x" * 100 for i in range(500)]
+        path = tmp_path / "log"
+        path.write_bytes(b"\n".join(lines) + b"\n")
+        assert _tail_lines(path, 120) == lines[-120:]
+
+
+class TestCountLines:
+    """Test entry counting for clear()."""
+
+    def test_counts_final_line_without_newline(self, tmp_path):
+        path = tmp_path / "log"
+        path.write_bytes(b"a\nb\nc")
+        assert _count_lines(path) == 3
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "log"
+        path.write_bytes(b"")
+        assert _count_lines(path) == 0
+
+
+class TestActivityLogger:
+    """Test buffering and flushing of log entries."""
+
+    def test_ok_entries_buffered_until_threshold(self, logger):
+        for i in range(_FLUSH_EVERY - 1):
+            logger.log("step", str(i))
+        assert not logger.log_file.exists()
+
+        logger.log("step", "last")
+        assert len(logger.log_file.read_bytes().splitlines()) == _FLUSH_EVERY
+
+    def test_error_status_flushes_immediately(self, logger):
+        logger.log("step", "fine")
+        logger.log("step", "boom", status="error")
+        lines = logger.log_file.read_bytes().splitlines()
+        assert [json.loads(line)["details"] for line in lines] == ["fine", "boom"]
+
+    def test_read_includes_buffered_entries(self, logger):
+        for i in range(5):
+            logger.log("step", str(i))
+        assert [e["details"] for e in logger.read(limit=3)] == ["2", "3", "4"]
+        assert len(logger.read(limit=0)) == 5
+
+    def test_clear_counts_buffered_entries(self, logger):
+        for i in range(3):
+            logger.log("step", str(i))
+        assert logger.clear() == 3
+        assert not logger.log_file.exists()
+        assert logger.read() == []
+        assert logger.clear() == 0
+
+    def test_logging_resumes_after_close(self, logger):
+        logger.log("step", "before")
+        logger.close()
+        logger.log("step", "after")
+        assert [e["details"] for e in logger.read()] == ["before", "after"]
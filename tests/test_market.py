@@ -0,0 +1,105 @@
+"""Tests for market command helpers."""
+
+import http.server
+import socket
+import sys
+import threading
+
+import pytest
+
+from src.commands.market import _count_tags, _fetch_page, _lookup_dns
+
+_PAGE = b"""<html><head><title>Shop</title>
+<style>.x:before { content: "<div>"; }</style>
+<script src="app.js"></script>
+<script>var s = "<a href='x'>" + '<div class=y>';</script>
+</head><body>
+<!-- <div>old</div> <a href="#"> -->
+<div class="c"><a href="/">home</a><img src="x.png"/>
+<DIV>text <a
+href="/b">b</a></div><p>1 < 2</p><img src=y></div>
+</body></html>"""
+
+
+@pytest.fixture(params=["lxml", "regex"])
+def parser(request, monkeypatch):
+    """Run a test against both the lxml and the regex counting path."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    else:
+        monkeypatch.setitem(sys.modules, "lxml", None)  # makes `from lxml import ...` fail
+    return request.param
+
+
+def test_count_tags(parser):
+    """Tags inside comments, scripts and styles are not counted on either path."""
+    assert _count_tags(_PAGE) == (2, 2, 2, 2)
+
+
+def test_count_tags_empty_page(parser):
+    assert _count_tags(b"") == (0, 0, 0, 0)
+
+
+def test_lookup_dns_returns_first_a_record(monkeypatch):
+    infos = [
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.215.14", 0)),
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.215.15", 0)),
+    ]
+    monkeypatch.setattr(socket, "getaddrinfo", lambda *args: infos)
+    assert _lookup_dns("example.com") == "93.184.215.14"
+
+
+def test_lookup_dns_unresolvable(monkeypatch):
+    def fail(*args):
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    monkeypatch.setattr(socket, "getaddrinfo", fail)
+    assert _lookup_dns("no-such-host.invalid") == "unavailable"
+
+
+@pytest.fixture
+def server():
+    """A local HTTP server: /page returns a small page, /old redirects to it."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/old":
+                self.send_response(301)
+                self.send_header("Location", "/page")
+                self.end_headers()
+                return
+            body = b"<html><title>Hi</title></html>"
+            self.send_response(200 if self.path == "/page" else 404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fetch_page_follows_redirects(server):
+    assert _fetch_page(f"http://{server}/old") == (b"<html><title>Hi</title></html>", "200")
+
+
+def test_fetch_page_defaults_to_http(server):
+    """A bare host:port is fetched over plain http, like curl."""
+    assert _fetch_page(f"{server}/page")[1] == "200"
+
+
+def test_fetch_page_reports_error_status(server):
+    assert _fetch_page(f"http://{server}/missing")[1] == "404"
+
+
+def test_fetch_page_unreachable():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    assert _fetch_page(f"http://127.0.0.1:{port}/", timeout=5) == (b"", "")
@@ -0,0 +1,90 @@
+"""Tests for recipe execution helpers."""
+
+import json
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from src.commands.recipe import (
+    _INDEX_FILE,
+    _finish_step,
+    _run_parallel,
+    _start_step,
+    recipe_app,
+)
+from src.core.config import invalidate_config
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def recipes(tmp_path, monkeypatch):
+    """Point the recipes directory at tmp_path and return it."""
+    monkeypatch.setenv("MEKON_DATA_DIR", str(tmp_path))
+    invalidate_config()
+    yield tmp_path / "recipes"
+    invalidate_config()
+
+
+def _index(recipes):
+    return json.loads((recipes / _INDEX_FILE).read_text())
+
+
+def test_failing_step_cancels_running_siblings():
+    """A failing step kills still-running siblings; finished ones keep their outcome."""
+    batch = [
+        (1, {"name": "ok", "command": "true"}),
+        (2, {"name": "bad", "command": "sleep 0.3; false"}),
+        (3, {"name": "slow", "command": "sleep 30"}),
+    ]
+    started = time.monotonic()
+    results = _run_parallel(batch, total=3)
+    assert time.monotonic() - started < 10
+    assert {idx: outcome for idx, (outcome, _) in results.items()} == {
+        1: "pass", 2: "fail", 3: "cancelled",
+    }
+
+
+def test_step_timeout_does_not_wait_for_grandchildren():
+    """A timed-out step returns promptly even if its shell's child still holds the pipes."""
+    started = time.monotonic()
+    outcome, _ = _finish_step(_start_step("sleep 5; echo hi"), timeout=1)
+    assert outcome == "timeout"
+    assert time.monotonic() - started < 4
+
+
+class TestRecipeIndex:
+    """Test the `recipe list` metadata index."""
+
+    def test_create_indexes_recipe(self, recipes):
+        result = runner.invoke(recipe_app, ["create", "deploy"])
+        assert result.exit_code == 0
+        assert _index(recipes)["deploy.json"]["steps"] == 1
+
+        result = runner.invoke(recipe_app, ["list"])
+        assert result.exit_code == 0
+        assert "deploy" in result.output
+
+    def test_edited_recipe_is_reparsed(self, recipes):
+        runner.invoke(recipe_app, ["create", "deploy"])
+        (recipes / "deploy.json").write_text(json.dumps({
+            "name": "deploy",
+            "description": "Ship it to production",
+            "steps": [{"command": "true"}, {"command": "true"}, {"command": "true"}],
+        }))
+
+        result = runner.invoke(recipe_app, ["list"])
+        assert result.exit_code == 0
+        assert "Ship it to production" in result.output
+        assert _index(recipes)["deploy.json"]["steps"] == 3
+
+    def test_invalid_and_removed_recipes(self, recipes):
+        runner.invoke(recipe_app, ["create", "old"])
+        (recipes / "old.json").unlink()
+        (recipes / "broken.json").write_text("{not json")
+
+        result = runner.invoke(recipe_app, ["list"])
+        assert result.exit_code == 0
+        assert "invalid json" in result.output
+        assert set(_index(recipes)) == {"broken.json"}